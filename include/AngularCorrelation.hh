@@ -247,6 +247,84 @@ public:
    */
   double operator()(const double theta, const double phi) const;
 
+  /**
+   * \brief Return the angular correlation at a single polar angle and two
+   * azimuthal angles.
+   *
+   * This is equivalent to two calls of the call operator, but the terms which
+   * only depend on the polar angle are evaluated only once. It is used to
+   * calculate analyzing powers.
+   *
+   * \param theta Polar angle in spherical coordinates in radians
+   * (\f$\theta \in \left[ 0, \pi \right]\f$).
+   * \param phi First azimuthal angle in spherical coordinates in radians
+   * (\f$\varphi \in \left[ 0, 2 \pi \right]\f$).
+   * \param phip Second azimuthal angle in spherical coordinates in radians
+   * (\f$\varphi^\prime \in \left[ 0, 2 \pi \right]\f$).
+   *
+   * \return \f$W_{\gamma \gamma} \left( \theta, \varphi \right)\f$ and
+   * \f$W_{\gamma \gamma} \left( \theta, \varphi^\prime \right)\f$
+   */
+  pair<double, double> at_two_azimuthal_angles(const double theta,
+                                               const double phi,
+                                               const double phip) const {
+    return w_gamma_gamma->at_two_azimuthal_angles(theta, phi, phip);
+  }
+
+  /**
+   * \brief Return the angular correlation at a single polar angle and several
+   * azimuthal angles.
+   *
+   * This is equivalent to one call of the call operator for each azimuthal
+   * angle, but the terms which only depend on the polar angle are evaluated
+   * only once. It is used to evaluate the angular correlation on a grid of
+   * angles.
+   *
+   * \param theta Polar angle in spherical coordinates in radians
+   * (\f$\theta \in \left[ 0, \pi \right]\f$).
+   * \param phi Azimuthal angles in spherical coordinates in radians
+   * (\f$\varphi_j \in \left[ 0, 2 \pi \right]\f$).
+   *
+   * \return \f$W_{\gamma \gamma} \left( \theta, \varphi_j \right)\f$ for
+   * all azimuthal angles \f$\varphi_j\f$
+   */
+  vector<double> at_azimuthal_angles(const double theta,
+                                     const vector<double> &phi) const {
+    return w_gamma_gamma->at_azimuthal_angles(theta, phi);
+  }
+
+  /**
+   * \brief Return the angular functions in the expansion of the angular
+   * correlation.
+   *
+   * The angular functions do not depend on the multipole mixing ratios.
+   * This method calls the equivalent method of the W_gamma_gamma member object.
+   *
+   * \param theta Polar angle in spherical coordinates in radians
+   * (\f$\theta \in \left[ 0, \pi \right]\f$).
+   * \param phi Azimuthal angle in spherical coordinates in radians
+   * (\f$\varphi \in \left[ 0, 2 \pi \right]\f$).
+   *
+   * \return Values of the angular functions.
+   */
+  vector<double> get_angular_basis(const double theta, const double phi) const {
+    return w_gamma_gamma->get_angular_basis(theta, phi);
+  }
+
+  /**
+   * \brief Evaluate the angular correlation from precomputed angular functions.
+   *
+   * This method calls the equivalent method of the W_gamma_gamma member object.
+   *
+   * \param angular_basis Values of the angular functions returned by
+   * get_angular_basis().
+   *
+   * \return \f$W_{\gamma \gamma} \left( \theta, \varphi \right)\f$
+   */
+  double evaluate_angular_basis(const vector<double> &angular_basis) const {
+    return w_gamma_gamma->evaluate_angular_basis(angular_basis);
+  }
+
   /**
    * \brief Return the initial state of the angular correlation.
    *
@@ -263,6 +341,24 @@ public:
     return w_gamma_gamma->get_cascade_steps();
   }
 
+  /**
+   * \brief Set the multipole mixing ratios of the cascade.
+   *
+   * Since the mixing ratios do not change the structure of the cascade, the
+   * input checks of the constructor are not repeated, and the W_gamma_gamma
+   * member object only recalculates the quantities which depend on the mixing
+   * ratios. This is much faster than creating a new AngularCorrelation object
+   * for each set of mixing ratios.
+   *
+   * \param deltas Multipole mixing ratios, one for each cascade step.
+   *
+   * \throw invalid_argument if the number of mixing ratios is not equal to the
+   * number of cascade steps.
+   */
+  void set_deltas(const vector<double> &deltas) {
+    w_gamma_gamma->set_deltas(deltas);
+  }
+
   /**
    * \brief Return an upper limit for possible values of the gamma-gamma angular
    * correlation.
@@ -241,6 +241,15 @@ public:
   UvCoefficient(const unsigned int two_nu, const int two_j, const int two_L,
                 const int two_Lp, const double delta, const int two_jp);
 
+  /**
+   * \brief Set the multipole mixing ratio.
+   *
+   * Reuses the Wigner-6j symbols, which do not depend on the mixing ratio.
+   *
+   * \param delta \f$\delta_m\f$
+   */
+  void set_delta(const double delta);
+
   double get_value() const { return value; };
 
   string string_representation(const unsigned int n_digits = 0,
@@ -254,8 +263,10 @@ protected:
   const int two_j;
   const int two_L;
   const int two_Lp;
-  const double delta;
+  double delta;
   const int two_jp;
 
   double value, value_L, value_Lp;
+  double value_Lp_unmixed; /**< Contribution of \f$L^\prime\f$ without the
+                              factor \f$\delta^2\f$ */
 };
\ No newline at end of file
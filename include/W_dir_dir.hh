@@ -113,6 +113,21 @@ public:
    */
   double operator()(const double theta) const;
 
+  /**
+   * \brief Return value of the dir-dir correlation for a given value of
+   * \f$\cos \left( \theta \right)\f$
+   *
+   * The single-argument call operator calls this method. It allows classes
+   * which need \f$\cos \left( \theta \right)\f$ for other terms as well,
+   * like W_pol_dir, to evaluate the cosine only once.
+   *
+   * \param cos_theta Cosine of the polar angle between the direction of the
+   * incoming and the outgoing photon.
+   *
+   * \return \f$W \left( \theta \right)\f$
+   */
+  double at_cos_theta(const double cos_theta) const;
+
   /**
    * \brief Return value of the dir-dir correlation at an angle \f$\theta\f$
    *
@@ -133,6 +148,71 @@ public:
     return operator()(theta);
   }
 
+  /**
+   * \brief Return value of the dir-dir correlation at an angle \f$\theta\f$
+   * for two azimuthal angles
+   *
+   * Since the direction-direction correlation is independent of the azimuthal
+   * angle, it is evaluated only once.
+   *
+   * \param theta Polar angle between the direction of the incoming and
+   * the outgoing photon in radians.
+   *
+   * \return \f$W \left( \theta \right)\f$ twice
+   */
+  pair<double, double> at_two_azimuthal_angles(const double theta,
+                                               const double,
+                                               const double) const override {
+    const double w = operator()(theta);
+    return {w, w};
+  }
+
+  /**
+   * \brief Evaluate the direction-direction correlation at a single polar angle
+   * and several azimuthal angles
+   *
+   * The direction-direction correlation does not depend on the azimuthal
+   * angle, so it is evaluated only once.
+   *
+   * \param theta Polar angle in spherical coordinates in radians
+   * (\f$\theta \in \left[ 0, \pi \right]\f$).
+   * \param phi Azimuthal angles in spherical coordinates in radians
+   * (\f$\varphi_j \in \left[ 0, 2 \pi \right]\f$). Only their number is
+   * used.
+   *
+   * \return \f$W \left( \theta \right)\f$ for each azimuthal angle
+   */
+  vector<double> at_azimuthal_angles(const double theta,
+                                     const vector<double> &phi) const override {
+    return vector<double>(phi.size(), operator()(theta));
+  }
+
+  /**
+   * \brief Return the Legendre polynomials \f$P_\nu \left[ \cos \left(
+   * \theta \right) \right]\f$ in the expansion of the dir-dir correlation
+   *
+   * \param theta Polar angle between the direction of the incoming and
+   * the outgoing photon in radians.
+   *
+   * \return Legendre polynomials for all even \f$\nu \leq \nu_\mathrm{max}\f$.
+   */
+  vector<double> get_angular_basis(const double theta,
+                                   const double) const override;
+
+  double
+  evaluate_angular_basis(const vector<double> &angular_basis) const override;
+
+  /**
+   * \brief Set the multipole mixing ratios of the cascade.
+   *
+   * Reuses the \f$A_\nu\f$ and \f$U_\nu\f$ coefficient objects, whose
+   * Wigner symbols do not depend on the mixing ratios, and recalculates the
+   * normalization factor and the expansion coefficients.
+   *
+   * \param deltas Multipole mixing ratios, one for each cascade step.
+   */
+  void set_deltas(const vector<double> &deltas) override;
+
   /**
    * \brief Return upper limit for the dir-dir correlation.
    *
@@ -19,6 +19,10 @@
 
 #pragma once
 
+#include <stdexcept>
+
+using std::invalid_argument;
+
 #include <vector>
 
 using std::vector;
@@ -84,6 +88,93 @@ public:
    */
   virtual double operator()(const double theta, const double phi) const = 0;
 
+  /**
+   * \brief Evaluate the angular correlation at a single polar angle and two
+   * azimuthal angles
+   *
+   * Analyzing powers compare the angular correlation at the same polar angle
+   * \f$\theta\f$ and two different azimuthal angles \f$\varphi\f$ and
+   * \f$\varphi^\prime\f$. This default implementation calls the call operator
+   * twice. Derived classes may override it to evaluate the terms which only
+   * depend on \f$\theta\f$ only once.
+   *
+   * \param theta Polar angle in spherical coordinates in radians
+   * (\f$\theta \in \left[ 0, \pi \right]\f$).
+   * \param phi First azimuthal angle in spherical coordinates in radians
+   * (\f$\varphi \in \left[ 0, 2 \pi \right]\f$).
+   * \param phip Second azimuthal angle in spherical coordinates in radians
+   * (\f$\varphi^\prime \in \left[ 0, 2 \pi \right]\f$).
+   *
+   * \return \f$W_{\gamma \gamma} \left( \theta, \varphi \right)\f$ and
+   * \f$W_{\gamma \gamma} \left( \theta, \varphi^\prime \right)\f$
+   */
+  virtual pair<double, double>
+  at_two_azimuthal_angles(const double theta, const double phi,
+                          const double phip) const {
+    return {operator()(theta, phi), operator()(theta, phip)};
+  }
+
+  /**
+   * \brief Evaluate the angular correlation at a single polar angle and
+   * several azimuthal angles
+   *
+   * This is used to evaluate the angular correlation on a grid of polar and
+   * azimuthal angles. This default implementation calls the call operator for
+   * each azimuthal angle. Derived classes may override it to evaluate the terms
+   * which only depend on \f$\theta\f$ only once.
+   *
+   * \param theta Polar angle in spherical coordinates in radians
+   * (\f$\theta \in \left[ 0, \pi \right]\f$).
+   * \param phi Azimuthal angles in spherical coordinates in radians
+   * (\f$\varphi_j \in \left[ 0, 2 \pi \right]\f$).
+   *
+   * \return \f$W_{\gamma \gamma} \left( \theta, \varphi_j \right)\f$ for
+   * all azimuthal angles \f$\varphi_j\f$
+   */
+  virtual vector<double> at_azimuthal_angles(const double theta,
+                                             const vector<double> &phi) const {
+    vector<double> result(phi.size());
+    for (size_t j = 0; j < phi.size(); ++j) {
+      result[j] = operator()(theta, phi[j]);
+    }
+    return result;
+  }
+
+  /**
+   * \brief Return the angular functions in the expansion of the angular
+   * correlation
+   *
+   * A gamma-gamma angular correlation is a sum of products of expansion
+   * coefficients, which depend on the multipole mixing ratios, and functions of
+   * the angles, which do not. To evaluate the angular correlation for many sets
+   * of mixing ratios at the same angles, the angular functions can be evaluated
+   * once with this method and passed to evaluate_angular_basis() for each set.
+   *
+   * \param theta Polar angle in spherical coordinates in radians
+   * (\f$\theta \in \left[ 0, \pi \right]\f$).
+   * \param phi Azimuthal angle in spherical coordinates in radians
+   * (\f$\varphi \in \left[ 0, 2 \pi \right]\f$).
+   *
+   * \return Values of the angular functions.
+   */
+  virtual vector<double> get_angular_basis(const double theta,
+                                           const double phi) const = 0;
+
+  /**
+   * \brief Evaluate the angular correlation from precomputed angular functions
+   *
+   * The result is the same as the one of the call operator at the angles for
+   * which the angular functions were evaluated, but only the expansion
+   * coefficients for the current mixing ratios need to be multiplied with them.
+   *
+   * \param angular_basis Values of the angular functions returned by
+   * get_angular_basis().
+   *
+   * \return \f$W_{\gamma \gamma} \left( \theta, \varphi \right)\f$
+   */
+  virtual double
+  evaluate_angular_basis(const vector<double> &angular_basis) const = 0;
+
   /**
    * \brief Return an upper limit for possible values of the gamma-gamma angular
    * correlation.
@@ -126,6 +217,30 @@ public:
     return cascade_steps;
   }
 
+  /**
+   * \brief Set the multipole mixing ratios of the cascade.
+   *
+   * The mixing ratios do not change the structure of the cascade, i.e. all
+   * quantities which only depend on the angular momenta and multipolarities
+   * remain valid. Derived classes override this method to recalculate only the
+   * quantities which depend on the mixing ratios.
+   *
+   * \param deltas Multipole mixing ratios, one for each cascade step.
+   *
+   * \throw invalid_argument if the number of mixing ratios is not equal to the
+   * number of cascade steps.
+   */
+  virtual void set_deltas(const vector<double> &deltas) {
+    if (deltas.size() != n_cascade_steps) {
+      throw invalid_argument(
+          "Number of multipole mixing ratios must be equal to the number of "
+          "cascade steps.");
+    }
+    for (size_t i = 0; i < n_cascade_steps; ++i) {
+      cascade_steps[i].first.delta = deltas[i];
+    }
+  }
+
   /**
    * @brief Calculate the normalization factor for the angular correlation.
    *
@@ -103,6 +103,80 @@ public:
    */
   double operator()(const double theta, const double phi) const override;
 
+  /**
+   * \brief Return value of the pol-dir correlation at an angle \f$\theta\f$
+   * for two azimuthal angles
+   *
+   * The dir-dir correlation and the sum over the associated Legendre
+   * polynomials only depend on \f$\theta\f$, so they are evaluated only once
+   * for both azimuthal angles.
+   *
+   * \param theta Polar angle between the direction of the incoming and
+   * the outgoing photon in radians.
+   * \param phi First azimuthal angle between the polarization axis of the first
+   * photon and the direction of the outgoing photon in radians.
+   * \param phip Second azimuthal angle between the polarization axis of the
+   * first photon and the direction of the outgoing photon in radians.
+   *
+   * \return \f$W \left( \theta, \varphi \right)\f$ and
+   * \f$W \left( \theta, \varphi^\prime \right)\f$
+   */
+  pair<double, double>
+  at_two_azimuthal_angles(const double theta, const double phi,
+                          const double phip) const override;
+
+  /**
+   * \brief Return value of the pol-dir correlation at an angle \f$\theta\f$
+   * for several azimuthal angles
+   *
+   * The dir-dir correlation and the sum over the associated Legendre
+   * polynomials only depend on \f$\theta\f$, so they are evaluated only once
+   * for all azimuthal angles.
+   *
+   * \param theta Polar angle between the direction of the incoming and
+   * the outgoing photon in radians.
+   * \param phi Azimuthal angles between the polarization axis of the first
+   * photon and the direction of the outgoing photon in radians.
+   *
+   * \return \f$W \left( \theta, \varphi_j \right)\f$ for all azimuthal angles
+   * \f$\varphi_j\f$
+   */
+  vector<double> at_azimuthal_angles(const double theta,
+                                     const vector<double> &phi) const override;
+
+  /**
+   * \brief Return the angular functions in the expansion of the pol-dir
+   * correlation
+   *
+   * These are the Legendre polynomials of the dir-dir correlation, followed by
+   * \f$\cos \left( 2 \varphi \right)\f$ and the associated Legendre
+   * polynomials \f$P_\nu^{\left( 2 \right)} \left[ \cos \left( \theta
+   * \right) \right]\f$.
+   *
+   * \param theta Polar angle between the direction of the incoming and
+   * the outgoing photon in radians.
+   * \param phi Azimuthal angle between the polarization axis of the first
+   * photon and the direction of the outgoing photon in radians.
+   *
+   * \return Values of the angular functions.
+   */
+  vector<double> get_angular_basis(const double theta,
+                                   const double phi) const override;
+
+  double
+  evaluate_angular_basis(const vector<double> &angular_basis) const override;
+
+  /**
+   * \brief Set the multipole mixing ratios of the cascade.
+   *
+   * Reuses the \f$\alpha_\nu\f$ and \f$A_\nu\f$ coefficients, which do not
+   * depend on the mixing ratios, and recalculates the normalization factor and
+   * the expansion coefficients.
+   *
+   * \param deltas Multipole mixing ratios, one for each cascade step.
+   */
+  void set_deltas(const vector<double> &deltas) override;
+
   /**
    * \brief Return upper limit for the pol-dir correlation.
    *
@@ -173,6 +247,22 @@ public:
       const vector<string> variable_names = {}) const override;
 
 protected:
+  /**
+   * \brief Return the \f$\theta\f$-dependent factor of the
+   * \f$\cos \left( 2 \varphi \right)\f$ term.
+   *
+   * This is the sum over the associated Legendre polynomials, including the
+   * sign which depends on the EM character of the first transition, but
+   * without the normalization factor.
+   *
+   * \param cos_theta Cosine of the polar angle between the direction of the
+   * incoming and the outgoing photon.
+   *
+   * \return \f$\pm \sum_\nu \alpha_\nu ... A_\nu P_\nu^{\left( 2
+   * \right)} \left[ \cos \left( \theta \right) \right]\f$
+   */
+  double polarization_term(const double cos_theta) const;
+
   /**
    * \brief Calculate the set of expansion coefficients for the pol-dir
    * correlation.
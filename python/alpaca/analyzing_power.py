@@ -15,17 +15,46 @@
 
 # Copyright (C) 2021-2023 Udo Friman-Gayer
 
+from collections import OrderedDict
 import warnings
 
 import numpy as np
 
-from alpaca.angular_correlation import AngularCorrelation
-from alpaca.transition import Transition
+from alpaca.angular_correlation import libangular_correlation
 
 CONVENTION = {"natural": 1.0, "KPZ": -1.0}
 
 
-def arctan_grid(n, abs_delta_max=100.0):
+def _check_arctan_grid_size(n, quiet):
+    """Correct and warn about an invalid or inconvenient number of grid points for arctan_grid
+
+    Parameters
+    ----------
+    n: int
+        Number of grid points requested by the user.
+    quiet: bool
+        Determines whether warnings are suppressed.
+
+    Returns
+    -------
+    int
+        Number of grid points that will be used.
+    """
+
+    if n < 2:
+        if not quiet:
+            warnings.warn(
+                "The number of grid points must be larger than one, so that at least the two limits of the interval can be included. Using n=2."
+            )
+        n = 2
+    if n % 2 == 0 and not quiet:
+        warnings.warn(
+            "An even number of grid points was given. While this is a perfectly valid input, please be aware that the set of points will not include a multipole mixing of exactly zero. Using any valid odd number will include it."
+        )
+    return n
+
+
+def arctan_grid(n, abs_delta_max=100.0, quiet=False):
     r"""Create an equidistant grid for the arctangent of the multipole-mixing ratio
 
     Multipole mixing ratios, as defined in the present code, are variables whose range includes
@@ -41,7 +70,7 @@ def arctan_grid(n, abs_delta_max=100.0):
     :math:`\mathrm{arctan} \left(\delta_i\right)`
     (:math:`i \in [0, N-1]`) in the range
     :math:`\left[ -\delta_\mathrm{max}, \delta_\mathrm{max}\right]`
-    (the range includes both :math:`-\delta_\mathrm{max}` and :math:`-\delta_\mathrm{max}`)
+    (the range includes both :math:`-\delta_\mathrm{max}` and :math:`\delta_\mathrm{max}`)
     on an arctangent-compressed axis, and returns a list of the corresponding :math:`\delta_i`.
     The arctangent transformation does exactly what is needed, i.e. compressing the infinitely
     large ranges where the alternative multipole dominates, while keeping a high grid density
@@ -56,6 +85,9 @@ def arctan_grid(n, abs_delta_max=100.0):
     abs_delta_max: float
         Maximum absolute value of the multipole mixing ratio which determines the limits of
         the symmetric grid (default: 100).
+    quiet: bool
+        Suppress the warnings about the number of grid points, for example when many grids are
+        created in a loop (default: False).
 
     Returns
     -------
@@ -65,21 +97,26 @@ def arctan_grid(n, abs_delta_max=100.0):
     Warns
     -----
     UserWarning
-        If the number of grid points is smaller than 2 or even.
+        If the number of grid points is smaller than 2 or even, and quiet is False.
     """
 
-    if n < 2:
-        warnings.warn(
-            "The number of grid points must be larger than one, so that at least the two limits of the interval can be included. Using n=2."
-        )
-        n = 2
-    if n % 2 == 0:
-        warnings.warn(
-            "An even number of grid points was given. While this is a perfectly valid input, please be aware that the set of points will not include a multipole mixing of exactly zero. Using any valid odd number will include it."
-        )
+    if n < 2 or n % 2 == 0:
+        n = _check_arctan_grid_size(n, quiet)
     arctan_delta_max = np.arctan(np.abs(abs_delta_max))
-    arctan_deltas = np.linspace(-arctan_delta_max, arctan_delta_max, n)
-    return np.tan(arctan_deltas)
+    # The grid is symmetric with respect to zero.
+    # Evaluate the tangent only for the non-negative half of the grid and mirror the result.
+    # This also ensures that the grid is exactly antisymmetric.
+    # Both halves are written directly into the output array.
+    arctan_deltas = np.linspace(
+        0.0 if n % 2 else arctan_delta_max / (n - 1), arctan_delta_max, n - n // 2
+    )
+    grid = np.empty(n)
+    np.tan(arctan_deltas, out=grid[n // 2 :])
+    # The tangent is ill-conditioned close to pi/2, so the limits would only be reproduced up to
+    # a few ulp. Use the exact value instead.
+    grid[-1] = np.abs(abs_delta_max)
+    np.negative(grid[: n - n // 2 - 1 : -1], out=grid[: n // 2])
+    return grid
 
 
 class AnalyzingPower:
@@ -154,14 +191,25 @@ class AnalyzingPower:
         Product of the photon polarization and the polarization sensitivity.
     convention: str
         'KPZ' for the convention of Kneissl, Pitz and Zilges, or 'natural' (default) for the natural convention.
+    cache_size: int
+        Maximum number of results of `AnalyzingPower.evaluate` that are cached.
+    n_threads: int or None
+        Number of threads used by `AnalyzingPower.evaluate`.
 
     Raises
     ------
     ValueError
-        If the absolute value of PQ is larger than 1.
+        If the absolute value of PQ is larger than 1, or if the convention is unknown.
     """
 
-    def __init__(self, angular_correlation, PQ=1.0, convention="natural"):
+    def __init__(
+        self,
+        angular_correlation,
+        PQ=1.0,
+        convention="natural",
+        cache_size=32,
+        n_threads=None,
+    ):
         """Initialization
 
         Define the angular correlation for which the analyzing power should be evaluated, and the
@@ -173,14 +221,81 @@ class AnalyzingPower:
             Angular correlation
         convention: str
             'KPZ' for the convention of Kneissl, Pitz and Zilges, or 'natural' (default) for the natural convention.
+        cache_size: int
+            Maximum number of results of `AnalyzingPower.evaluate` that are cached (default: 32).
+            The least recently used results are discarded first.
+            Set to 0 to disable the cache.
+        n_threads: int or None
+            Maximum number of threads among which the mixing ratios of `AnalyzingPower.evaluate`
+            are split (default: None, i.e. the number of processors).
+            Since each thread sets up its own angular correlation in the C++ code, at most one
+            thread per 1000 mixing ratios is used.
+            See `AngularCorrelation.evaluate_delta_scan`.
         """
+        self.cache_size = cache_size
+        self.n_threads = n_threads
+        # The cache is a plain dictionary of this object. A functools.lru_cache around a bound
+        # method would create a reference cycle, so that the object and its angular correlation
+        # would only be deleted by the cyclic garbage collector.
+        self._cache = OrderedDict()
         self.angular_correlation = angular_correlation
+        self._set_PQ_convention(PQ, convention)
+
+    @property
+    def angular_correlation(self):
+        """Angular correlation"""
+        return self._angular_correlation
+
+    @angular_correlation.setter
+    def angular_correlation(self, angular_correlation):
+        # The cache key does not contain the cascade.
+        self._angular_correlation = angular_correlation
+        self.clear_cache()
+
+    @property
+    def PQ(self):
+        """Product of the photon polarization and the polarization sensitivity"""
+        return self._PQ
+
+    @PQ.setter
+    def PQ(self, PQ):
+        self._set_PQ_convention(PQ, self._convention)
+
+    @property
+    def convention(self):
+        """'KPZ' for the convention of Kneissl, Pitz and Zilges, or 'natural'"""
+        return self._convention
+
+    @convention.setter
+    def convention(self, convention):
+        self._set_PQ_convention(self._PQ, convention)
+
+    def _set_PQ_convention(self, PQ, convention):
+        """Set PQ and the convention, and update the prefactor of the analyzing power
+
+        Results of `AnalyzingPower.evaluate` that were cached with the previous prefactor are
+        discarded.
+
+        Raises
+        ------
+        ValueError
+            If the absolute value of PQ is larger than 1, or if the convention is unknown.
+        """
         if np.abs(PQ) > 1.0:
             raise ValueError(
                 "The absolute value of PQ must be smaller than or equal to 1."
             )
-        self.PQ = PQ
-        self.convention = convention
+        if convention not in CONVENTION:
+            raise ValueError(
+                "Unknown convention '{}'. Valid conventions are: {}.".format(
+                    convention, ", ".join("'" + c + "'" for c in CONVENTION)
+                )
+            )
+        self._PQ = PQ
+        self._convention = convention
+        # Prefactor of the analyzing power, which does not depend on the angles.
+        self._sign = PQ * CONVENTION[convention]
+        self.clear_cache()
 
     def __call__(self, theta=0.5 * np.pi, thetap=None, phi=0.0, phip=0.5 * np.pi):
         r"""Evaluate the analyzing power
@@ -196,19 +311,99 @@ class AnalyzingPower:
 
         Returns
         -------
-        float, :math:`A \left( \theta \right)`
+        float or ndarray, :math:`A \left( \theta \right)`
+            If all angles are scalars, a scalar will be returned.
+            Otherwise, the angles are broadcast against each other, and an array with the
+            broadcast shape will be returned.
+            If the angular correlation vanishes in both directions, the analyzing power is
+            zero.
         """
 
-        w_para = self.angular_correlation(theta, phi)
-        w_perp = self.angular_correlation(thetap if thetap is not None else theta, phip)
+        if thetap is None:
+            thetap = theta
+
+        # Both directions and the ratio are evaluated by the C++ code with a single call.
+        angles = np.broadcast_arrays(theta, thetap, phi, phip)
+        shape = angles[0].shape
+        angles = [np.ascontiguousarray(a, dtype=float).ravel() for a in angles]
+        ana_pow = np.empty(len(angles[0]))
+        libangular_correlation.evaluate_analyzing_power(
+            self.angular_correlation._checked_pointer(),
+            len(ana_pow),
+            *angles,
+            self._sign,
+            ana_pow,
+        )
+
+        if shape == ():
+            return float(ana_pow[0])
+        return np.reshape(ana_pow, shape)
+
+    @staticmethod
+    def _stack_angles(theta, thetap, phi, phip):
+        r"""Stack the angles of both directions, so that they can be evaluated with a single call
 
+        Returns
+        -------
+        (ndarray, ndarray, tuple)
+            Polar and azimuthal angles, where the first half of each array contains the
+            angles :math:`\theta` and :math:`\varphi`, and the second half the angles
+            :math:`\theta^\prime` and :math:`\varphi^\prime`, and the broadcast shape of the
+            input angles.
+        """
+        if thetap is None:
+            thetap = theta
+
+        angles = np.broadcast(theta, thetap, phi, phip)
         return (
-            self.PQ
-            * CONVENTION[self.convention]
-            * (w_para - w_perp)
-            / (w_para + w_perp)
+            np.concatenate(
+                (
+                    np.broadcast_to(theta, angles.shape).ravel(),
+                    np.broadcast_to(thetap, angles.shape).ravel(),
+                )
+            ),
+            np.concatenate(
+                (
+                    np.broadcast_to(phi, angles.shape).ravel(),
+                    np.broadcast_to(phip, angles.shape).ravel(),
+                )
+            ),
+            angles.shape,
         )
 
+    def _ratio(self, w):
+        """Calculate the analyzing power from the angular correlation in both directions
+
+        Parameters
+        ----------
+        w: ndarray
+            Angular correlation at the angles returned by `_stack_angles` along the last axis.
+            The array is overwritten.
+
+        Returns
+        -------
+        ndarray
+            Analyzing power, whose last axis has half the length of the last axis of w.
+        """
+        n = w.shape[-1] // 2
+        w_para = w[..., :n]
+        w_perp = w[..., n:]
+
+        # The array w is owned by the caller, so the denominator can be computed in place.
+        # Together with the in-place operations on the numerator, this avoids allocating
+        # temporary arrays for the intermediate results.
+        ana_pow = np.subtract(w_para, w_perp)
+        ana_pow *= self._sign
+        w_perp += w_para
+        # If the angular correlation vanishes in both directions, the analyzing power is set to
+        # zero instead of NaN, like in the C function evaluate_analyzing_power in
+        # source/AngularCorrelation.cc.
+        vanishes = w_perp == 0.0
+        np.divide(ana_pow, w_perp, out=ana_pow, where=~vanishes)
+        ana_pow[vanishes] = 0.0
+
+        return ana_pow
+
     def evaluate(
         self,
         delta,
@@ -220,8 +415,9 @@ class AnalyzingPower:
     ):
         r"""Evaluate the analyzing power for a given value of the multipole mixing ratio
 
-        Based on the cascade in this AnalyzingPower object, this function creates a new object
-        with the given values of the multipole mixing ratio.
+        Based on the cascade in this AnalyzingPower object, this function evaluates the analyzing
+        power with the given values of the multipole mixing ratio.
+        The loop over the values is done by the C++ code.
         It is assumed that only one variable is needed to obtain all the mixing ratios of the
         cascade.
 
@@ -254,68 +450,134 @@ class AnalyzingPower:
 
         Returns
         -------
-        float
+        float or ndarray
             Value of the analyzing power at the given multipole mixing ratio.
+            If delta and all angles are scalars, a scalar will be returned.
+            Otherwise, an array with the shape of delta, followed by the broadcast shape of the
+            angles, will be returned.
         """
         original_shape = np.shape(delta)
-        scalar_output = isinstance(delta, (int, float))
-        delta = np.reshape(delta, (np.size(delta),))
-        asymmetries = np.zeros(len(delta))
-
-        for i, d in enumerate(delta):
-            cascade_steps = []
-            for j, cas_ste in enumerate(self.angular_correlation.cascade_steps):
-                if isinstance(delta_values[j], str):
-                    cascade_steps.append(
-                        [
-                            Transition(
-                                cas_ste[0].em_char,
-                                cas_ste[0].two_L,
-                                cas_ste[0].em_charp,
-                                cas_ste[0].two_Lp,
-                                d,
-                            ),
-                            cas_ste[1],
-                        ]
-                    )
-                elif callable(delta_values[j]):
-                    cascade_steps.append(
-                        [
-                            Transition(
-                                cas_ste[0].em_char,
-                                cas_ste[0].two_L,
-                                cas_ste[0].em_charp,
-                                cas_ste[0].two_Lp,
-                                delta_values[j](d),
-                            ),
-                            cas_ste[1],
-                        ]
-                    )
-                else:
-                    cascade_steps.append(
-                        [
-                            Transition(
-                                cas_ste[0].em_char,
-                                cas_ste[0].two_L,
-                                cas_ste[0].em_charp,
-                                cas_ste[0].two_Lp,
-                                delta_values[j],
-                            ),
-                            cas_ste[1],
-                        ]
-                    )
-            ana_pow = AnalyzingPower(
-                AngularCorrelation(
-                    self.angular_correlation.initial_state, cascade_steps
-                ),
-                PQ=self.PQ,
-                convention=self.convention,
+        # Numpy scalars and zero-dimensional arrays are treated like Python scalars.
+        scalar_output = original_shape == ()
+        delta = np.ravel(np.asarray(delta, dtype=float))
+
+        # If no mixing ratio depends on the variable, the analyzing power is the same for all
+        # values of the variable, and it is sufficient to evaluate it once.
+        depends_on_delta = any(
+            isinstance(delta_value, str) or callable(delta_value)
+            for delta_value in delta_values[: self.angular_correlation.n_cas_ste]
+        )
+
+        # Collect the mixing ratios of all cascade steps for all values of the variable, so that
+        # the angular correlations can be evaluated with a single call of the C++ code.
+        deltas = np.empty(
+            (len(delta) if depends_on_delta else 1, self.angular_correlation.n_cas_ste)
+        )
+        for j in range(self.angular_correlation.n_cas_ste):
+            delta_value = delta_values[j]
+            if isinstance(delta_value, str):
+                deltas[:, j] = delta
+            elif callable(delta_value):
+                deltas[:, j] = [delta_value(d) for d in delta]
+            else:
+                deltas[:, j] = delta_value
+
+        theta, phi, shape = self._stack_angles(theta, thetap, phi, phip)
+        # Arrays are not hashable, so their bytes are used as the key of the cache.
+        asymmetries = self._evaluate_delta_scan(
+            deltas.tobytes(),
+            np.concatenate((theta, phi)).astype(float).tobytes(),
+        )
+        if not depends_on_delta:
+            asymmetries = np.broadcast_to(
+                asymmetries, (len(delta), asymmetries.shape[1])
             )
-            asymmetries[i] = ana_pow(
-                theta, thetap if thetap is not None else theta, phi, phip
+
+        if scalar_output and shape == ():
+            return float(asymmetries[0, 0])
+        # Return a copy, so that the cached result can not be modified.
+        return np.reshape(asymmetries, original_shape + shape).copy()
+
+    def scan(self, theta, delta, delta_values, phi=0.0, phip=0.5 * np.pi):
+        r"""Evaluate the analyzing power on a grid of polar angles and multipole mixing ratios
+
+        This function evaluates the analyzing power :math:`A \left( \theta, \delta \right)`
+        for all combinations of the given polar angles (:math:`\theta = \theta^\prime`) and
+        values of the variable with a single call of `AnalyzingPower.evaluate`.
+
+        Parameters
+        ----------
+        theta: (M,) ndarray or list of float
+            Polar angles :math:`\theta` in radians.
+        delta: (N,) ndarray or list of float
+            Values of the variable.
+        delta_values: list of str or float or callable
+            Relation between the variable and the mixing ratios of the cascade.
+            See `AnalyzingPower.evaluate`.
+        phi, phip: float
+            Azimuthal angles :math:`\varphi` and :math:`\varphi^\prime` in radians (default: 0 and 90 degrees).
+
+        Returns
+        -------
+        (M, N) ndarray
+            Analyzing power, where the polar angle varies along the rows, and the variable along
+            the columns.
+        """
+        return np.ascontiguousarray(
+            self.evaluate(
+                np.ravel(delta), delta_values, np.ravel(theta), None, phi, phip
+            ).T
+        )
+
+    def _evaluate_delta_scan(self, deltas, angles):
+        """Evaluate the analyzing power for many sets of mixing ratios, or return a cached result
+
+        The least recently used result is discarded if more than `cache_size` results are cached.
+        See `_evaluate_delta_scan_uncached` for the arguments and the return value.
+        """
+        key = (deltas, angles)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        asymmetries = self._evaluate_delta_scan_uncached(deltas, angles)
+        if self.cache_size is None or self.cache_size > 0:
+            self._cache[key] = asymmetries
+            if self.cache_size is not None and len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return asymmetries
+
+    def _evaluate_delta_scan_uncached(self, deltas, angles):
+        """Evaluate the analyzing power for many sets of mixing ratios
+
+        Its arguments are the byte representations of the arrays used by
+        `AnalyzingPower.evaluate`.
+
+        Parameters
+        ----------
+        deltas: bytes
+            Mixing ratios of all cascade steps, an (N, n_cas_ste) array of float.
+        angles: bytes
+            Polar and azimuthal angles returned by `_stack_angles`, concatenated.
+
+        Returns
+        -------
+        ndarray
+            Read-only analyzing power, array of shape (N, M), where M is the number of
+            angles of one direction.
+        """
+        angles = np.frombuffer(angles).reshape(2, -1)
+        asymmetries = self._ratio(
+            self.angular_correlation.evaluate_delta_scan(
+                np.frombuffer(deltas).reshape(-1, self.angular_correlation.n_cas_ste),
+                angles[0],
+                angles[1],
+                n_threads=self.n_threads,
             )
-            # Avoid memory leaking by deleting the temporarily created AngularCorrelation objects.
-            ana_pow.angular_correlation.free()
-        if scalar_output:
-            return asymmetries[0]
-        return np.reshape(asymmetries, original_shape)
+        )
+        asymmetries.flags.writeable = False
+        return asymmetries
+
+    def clear_cache(self):
+        """Discard all cached results of `AnalyzingPower.evaluate`"""
+        self._cache.clear()
@@ -16,15 +16,14 @@
 # Copyright (C) 2021-2023 Udo Friman-Gayer
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
+from matplotlib.markers import MarkerStyle
 import numpy as np
 
 from .analyzing_power import AnalyzingPower, arctan_grid
-from .angular_correlation import AngularCorrelation
 from .interval_intersections import intersection
 from .inversion_by_grid_evaluation import invert_grid
 from .level_scheme_plotter import LevelSchemePlotter
-from .state import State
-from .transition import Transition
 
 
 class AnalyzingPowerPlotter:
@@ -55,6 +54,8 @@ class AnalyzingPowerPlotter:
         self.analyzing_power_experimental = analyzing_power_experimental
         self.markers = markers
         self.output_file_name = output_file_name
+        self._ana_pow = None
+        self._ana_pow_key = None
 
         self.abs_delta_max = 100.0
         self.fontsize_ticks = 10
@@ -109,59 +110,91 @@ class AnalyzingPowerPlotter:
         self.marker_zero = "s"
         self.marker_positive_infinity = "^"
 
+    def _analyzing_power(self):
+        # Reuse the AnalyzingPower object, and with it its cache of evaluated mixing ratios, as
+        # long as neither the angular correlation nor the convention have been replaced.
+        key = (id(self.angular_correlation), self.convention)
+        if self._ana_pow_key != key:
+            self._ana_pow = AnalyzingPower(
+                self.angular_correlation, convention=self.convention
+            )
+            self._ana_pow_key = key
+        return self._ana_pow
+
     def evaluate(self, deltas):
-        ana_pow_1 = np.zeros(len(deltas))
-        ana_pow_2 = np.zeros(len(deltas))
-
-        for i, delta in enumerate(deltas):
-            initial_state = self.angular_correlation.initial_state
-            cascade_steps = []
-            for j, cas in enumerate(self.angular_correlation.cascade_steps):
-                if isinstance(self.delta_values[j], str):
-                    cascade_steps.append(
-                        [
-                            Transition(
-                                cas[0].em_char,
-                                cas[0].two_L,
-                                cas[0].em_charp,
-                                cas[0].two_Lp,
-                                delta,
-                            ),
-                            cas[1],
-                        ]
-                    )
-                else:
-                    cascade_steps.append(
-                        [
-                            Transition(
-                                cas[0].em_char,
-                                cas[0].two_L,
-                                cas[0].em_charp,
-                                cas[0].two_Lp,
-                                self.delta_values[j],
-                            ),
-                            cas[1],
-                        ]
-                    )
-            ana_pow_1[i] = AnalyzingPower(
-                AngularCorrelation(initial_state, cascade_steps),
-                convention=self.convention,
-            )(theta=self.theta_1)
-            ana_pow_2[i] = AnalyzingPower(
-                AngularCorrelation(initial_state, cascade_steps),
-                convention=self.convention,
-            )(theta=self.theta_2)
-
-        return (ana_pow_1, ana_pow_2)
+        # Evaluate the analyzing power at both polar angles and all mixing ratios with a single
+        # batched call instead of creating new angular correlations for each mixing ratio.
+        ana_pow = self._analyzing_power().scan(
+            [self.theta_1, self.theta_2], deltas, self.delta_values
+        )
+
+        return (ana_pow[0], ana_pow[1])
+
+    def _fill_bands(self, ax, bands, vertical=False, hatched=False):
+        # Fill the ranges bands of the y axis (the x axis if vertical is True) over the full range
+        # of the other axis.
+        # All bands are drawn as a single collection, whose coordinates along the other axis are
+        # given in axes coordinates, like for axhspan and axvspan.
+        # The style is the one of the experimental ranges, or a hatch for the allowed ranges of
+        # the mixing ratio.
+        if hatched:
+            style = {
+                "facecolor": "none",
+                "edgecolor": self.exp_result_hatch_color,
+                "hatch": self.exp_result_hatch,
+            }
+        else:
+            style = {"color": self.exp_fill_color, "alpha": self.exp_alpha}
+        if vertical:
+            verts = [[(lo, 0.0), (lo, 1.0), (hi, 1.0), (hi, 0.0)] for lo, hi in bands]
+            transform = ax.get_xaxis_transform()
+        else:
+            verts = [[(0.0, lo), (1.0, lo), (1.0, hi), (0.0, hi)] for lo, hi in bands]
+            transform = ax.get_yaxis_transform()
+        ax.add_collection(
+            PolyCollection(verts, transform=transform, **style), autolim=False
+        )
+
+    def _plot_markers(self, ax, x, y):
+        # Mark the points that correspond to the lower limit, zero, and the upper limit of the
+        # mixing ratio.
+        # All three markers are drawn as a single collection, whose paths are replaced by the
+        # shapes of the individual markers.
+        markers = [
+            MarkerStyle(marker)
+            for marker in (
+                self.marker_negative_infinity,
+                self.marker_zero,
+                self.marker_positive_infinity,
+            )
+        ]
+        ax.scatter(
+            x,
+            y,
+            s=self.marker_size**2,
+            color=self.marker_color,
+            zorder=2,
+        ).set_paths(
+            [
+                marker.get_path().transformed(marker.get_transform())
+                for marker in markers
+            ]
+        )
 
     def plot(self, n_delta=100):
         abs_delta_max = 100.0
         arctan_delta_max = np.arctan(abs_delta_max)
-        arctan_delta = np.linspace(-arctan_delta_max, arctan_delta_max, n_delta)
-        delta = np.tan(arctan_delta)
+        # arctan_grid returns the limits exactly and evaluates the tangent only for one half of the
+        # symmetric grid.
+        # The grid is equidistant on the arctangent axis, so the positions of the grid points on
+        # that axis are known without evaluating the arctangent.
+        delta = arctan_grid(n_delta, abs_delta_max, quiet=True)
+        arctan_delta = np.linspace(-arctan_delta_max, arctan_delta_max, len(delta))
         ana_pow_1, ana_pow_2 = self.evaluate(delta)
         if self.markers:
-            delta_zero_index = np.argmin(np.abs(delta))
+            # Indices of the lower limit, the value closest to zero, and the upper limit of the
+            # mixing ratio.
+            marker_indices = [0, np.argmin(np.abs(delta)), -1]
 
         ana_pow_1_min = np.min(ana_pow_1)
         ana_pow_1_max = np.max(ana_pow_1)
@@ -180,41 +213,37 @@ class AnalyzingPowerPlotter:
         )
 
         if self.analyzing_power_experimental is not None:
+            # Ranges of the experimental analyzing power at both polar angles, i.e. the value
+            # plus or minus its uncertainty.
+            ana_pow_1_exp_lim = (
+                self.analyzing_power_experimental[0][0]
+                - self.analyzing_power_experimental[0][1],
+                self.analyzing_power_experimental[0][0]
+                + self.analyzing_power_experimental[0][1],
+            )
+            ana_pow_2_exp_lim = (
+                self.analyzing_power_experimental[1][0]
+                - self.analyzing_power_experimental[1][1],
+                self.analyzing_power_experimental[1][0]
+                + self.analyzing_power_experimental[1][1],
+            )
+
+            # The grid is the same for both polar angles, so both are evaluated with one scan.
             delta_values = arctan_grid(1001, abs_delta_max)
+            ana_pow = self._analyzing_power().scan(
+                [self.theta_1, self.theta_2], delta_values, self.delta_values
+            )
             ana_pow_1_allowed_deltas = invert_grid(
                 delta_values,
-                AnalyzingPower(
-                    self.angular_correlation, convention=self.convention
-                ).evaluate(
-                    delta=delta_values,
-                    delta_values=self.delta_values,
-                    theta=self.theta_1,
-                ),
-                [
-                    self.analyzing_power_experimental[0][0]
-                    - self.analyzing_power_experimental[0][1],
-                    self.analyzing_power_experimental[0][0]
-                    + self.analyzing_power_experimental[0][1],
-                ],
+                ana_pow[0],
+                ana_pow_1_exp_lim,
                 return_intervals=True,
             )
 
-            delta_values = arctan_grid(1001, abs_delta_max)
             ana_pow_2_allowed_deltas = invert_grid(
                 delta_values,
-                AnalyzingPower(
-                    self.angular_correlation, convention=self.convention
-                ).evaluate(
-                    delta=delta_values,
-                    delta_values=self.delta_values,
-                    theta=self.theta_2,
-                ),
-                [
-                    self.analyzing_power_experimental[1][0]
-                    - self.analyzing_power_experimental[1][1],
-                    self.analyzing_power_experimental[1][0]
-                    + self.analyzing_power_experimental[1][1],
-                ],
+                ana_pow[1],
+                ana_pow_2_exp_lim,
                 return_intervals=True,
             )
 
@@ -222,6 +251,16 @@ class AnalyzingPowerPlotter:
                 ana_pow_1_allowed_deltas, ana_pow_2_allowed_deltas
             )
 
+            # The limits of the intervals are shown on the arctangent axis in two panels each, so
+            # the arctangent is evaluated once for all of them.
+            arctan_ana_pow_1_allowed_deltas = np.arctan(
+                np.reshape(ana_pow_1_allowed_deltas, (-1, 2))
+            )
+            arctan_ana_pow_2_allowed_deltas = np.arctan(
+                np.reshape(ana_pow_2_allowed_deltas, (-1, 2))
+            )
+            arctan_allowed_deltas = np.arctan(np.reshape(allowed_deltas, (-1, 2)))
+
         fig, ax = plt.subplots(2, 2, figsize=(7, 7))
         plt.subplots_adjust(wspace=0.1, hspace=0.1)
 
@@ -235,62 +274,15 @@ class AnalyzingPowerPlotter:
         ax[0][0].set_yticklabels(self.arctan_delta_tick_labels)
         ax[0][0].plot(ana_pow_2, arctan_delta, color=self.ana_pow_color)
         if self.analyzing_power_experimental is not None:
-            ax[0][0].fill_betweenx(
-                self.arctan_delta_lim,
-                [
-                    self.analyzing_power_experimental[1][0]
-                    - self.analyzing_power_experimental[1][1],
-                    self.analyzing_power_experimental[1][0]
-                    - self.analyzing_power_experimental[1][1],
-                ],
-                [
-                    self.analyzing_power_experimental[1][0]
-                    + self.analyzing_power_experimental[1][1],
-                    self.analyzing_power_experimental[1][0]
-                    + self.analyzing_power_experimental[1][1],
-                ],
-                color=self.exp_fill_color,
-                alpha=self.exp_alpha,
-            )
+            self._fill_bands(ax[0][0], [ana_pow_2_exp_lim], vertical=True)
 
-            for interval in ana_pow_2_allowed_deltas:
-                ax[0][0].fill_between(
-                    ana_pow_2_lim,
-                    [np.arctan(interval[0])] * 2,
-                    [np.arctan(interval[1])] * 2,
-                    color=self.exp_fill_color,
-                    alpha=self.exp_alpha,
-                )
-            for interval in allowed_deltas:
-                ax[0][0].fill_between(
-                    ana_pow_2_lim,
-                    [np.arctan(interval[0])] * 2,
-                    [np.arctan(interval[1])] * 2,
-                    facecolor="none",
-                    edgecolor=self.exp_result_hatch_color,
-                    hatch=self.exp_result_hatch,
-                )
+            self._fill_bands(ax[0][0], arctan_ana_pow_2_allowed_deltas)
+            self._fill_bands(ax[0][0], arctan_allowed_deltas, hatched=True)
         if self.markers:
-            ax[0][0].plot(
-                ana_pow_2[0],
-                [-arctan_delta_max],
-                self.marker_negative_infinity,
-                color=self.marker_color,
-                markersize=self.marker_size,
-            )
-            ax[0][0].plot(
-                ana_pow_2[delta_zero_index],
-                [0.0],
-                self.marker_zero,
-                color=self.marker_color,
-                markersize=self.marker_size,
-            )
-            ax[0][0].plot(
-                ana_pow_2[-1],
-                [arctan_delta_max],
-                self.marker_positive_infinity,
-                color=self.marker_color,
-                markersize=self.marker_size,
+            self._plot_markers(
+                ax[0][0],
+                ana_pow_2[marker_indices],
+                [-arctan_delta_max, 0.0, arctan_delta_max],
             )
         ax_00x = ax[0][0].twiny()
         ax_00x.set_xlabel(
@@ -356,57 +348,11 @@ class AnalyzingPowerPlotter:
                 capsize=self.exp_cap_size,
                 color=self.exp_color,
             )
-            ax[1][0].fill_between(
-                ana_pow_2_lim,
-                [
-                    self.analyzing_power_experimental[0][0]
-                    - self.analyzing_power_experimental[0][1]
-                ]
-                * 2,
-                [
-                    self.analyzing_power_experimental[0][0]
-                    + self.analyzing_power_experimental[0][1]
-                ]
-                * 2,
-                color=self.exp_fill_color,
-                alpha=self.exp_alpha,
-            )
-            ax[1][0].fill_betweenx(
-                ana_pow_1_lim,
-                [
-                    self.analyzing_power_experimental[1][0]
-                    - self.analyzing_power_experimental[1][1]
-                ]
-                * 2,
-                [
-                    self.analyzing_power_experimental[1][0]
-                    + self.analyzing_power_experimental[1][1]
-                ]
-                * 2,
-                color=self.exp_fill_color,
-                alpha=self.exp_alpha,
-            )
+            self._fill_bands(ax[1][0], [ana_pow_1_exp_lim])
+            self._fill_bands(ax[1][0], [ana_pow_2_exp_lim], vertical=True)
         if self.markers:
-            ax[1][0].plot(
-                ana_pow_2[0],
-                [ana_pow_1[0]],
-                self.marker_negative_infinity,
-                color=self.marker_color,
-                markersize=self.marker_size,
-            )
-            ax[1][0].plot(
-                ana_pow_2[delta_zero_index],
-                [ana_pow_1[delta_zero_index]],
-                self.marker_zero,
-                color=self.marker_color,
-                markersize=self.marker_size,
-            )
-            ax[1][0].plot(
-                ana_pow_2[-1],
-                [ana_pow_1[-1]],
-                self.marker_positive_infinity,
-                color=self.marker_color,
-                markersize=self.marker_size,
+            self._plot_markers(
+                ax[1][0], ana_pow_2[marker_indices], ana_pow_1[marker_indices]
             )
         if self.abcd is not None:
             ax[1][0].text(
@@ -440,62 +386,17 @@ class AnalyzingPowerPlotter:
         ax_11y.set_ylim(ana_pow_1_lim)
         ax[1][1].plot(arctan_delta, ana_pow_1, color=self.ana_pow_color)
         if self.analyzing_power_experimental is not None:
-            ax[1][1].fill_between(
-                self.arctan_delta_lim,
-                [
-                    self.analyzing_power_experimental[0][0]
-                    - self.analyzing_power_experimental[0][1],
-                    self.analyzing_power_experimental[0][0]
-                    - self.analyzing_power_experimental[0][1],
-                ],
-                [
-                    self.analyzing_power_experimental[0][0]
-                    + self.analyzing_power_experimental[0][1],
-                    self.analyzing_power_experimental[0][0]
-                    + self.analyzing_power_experimental[0][1],
-                ],
-                color=self.exp_fill_color,
-                alpha=self.exp_alpha,
-            )
+            self._fill_bands(ax[1][1], [ana_pow_1_exp_lim])
 
-            for interval in ana_pow_1_allowed_deltas:
-                ax[1][1].fill_betweenx(
-                    ana_pow_1_lim,
-                    [np.arctan(interval[0])] * 2,
-                    [np.arctan(interval[1])] * 2,
-                    color=self.exp_fill_color,
-                    alpha=self.exp_alpha,
-                )
-            for interval in allowed_deltas:
-                ax[1][1].fill_betweenx(
-                    ana_pow_1_lim,
-                    [np.arctan(interval[0])] * 2,
-                    [np.arctan(interval[1])] * 2,
-                    facecolor="none",
-                    edgecolor=self.exp_result_hatch_color,
-                    hatch=self.exp_result_hatch,
-                )
-        if self.markers:
-            ax[1][1].plot(
-                [-arctan_delta_max],
-                [ana_pow_1[0]],
-                self.marker_negative_infinity,
-                color=self.marker_color,
-                markersize=self.marker_size,
-            )
-            ax[1][1].plot(
-                [0.0],
-                [ana_pow_1[delta_zero_index]],
-                self.marker_zero,
-                color=self.marker_color,
-                markersize=self.marker_size,
+            self._fill_bands(ax[1][1], arctan_ana_pow_1_allowed_deltas, vertical=True)
+            self._fill_bands(
+                ax[1][1], arctan_allowed_deltas, vertical=True, hatched=True
             )
-            ax[1][1].plot(
-                [arctan_delta_max],
-                [ana_pow_1[-1]],
-                self.marker_positive_infinity,
-                color=self.marker_color,
-                markersize=self.marker_size,
+        if self.markers:
+            self._plot_markers(
+                ax[1][1],
+                [-arctan_delta_max, 0.0, arctan_delta_max],
+                ana_pow_1[marker_indices],
             )
         if self.abcd is not None:
             ax[1][1].text(
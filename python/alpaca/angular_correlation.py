@@ -15,8 +15,11 @@
 
 # Copyright (C) 2021-2023 Udo Friman-Gayer
 
-from ctypes import byref, cdll, c_double, c_int, c_short, c_size_t, c_void_p, POINTER
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import byref, cdll, c_double, c_int, c_short, c_size_t, c_void_p
+import os
 import warnings
+import weakref
 
 import numpy as np
 
@@ -27,16 +30,29 @@ libangular_correlation = cdll.LoadLibrary(
     "@PROJECT_BINARY_DIR@/source/libangular_correlation.so"
 )
 
+# Numpy dtypes of the C types. They are resolved only once, because the conversion of a ctypes
+# type to a dtype takes longer than the creation of a small array.
+_int = np.dtype(c_int)
+_short = np.dtype(c_short)
+_pointer = np.dtype(c_void_p)
+
+# Arrays are passed to the C++ code as C-contiguous numpy arrays, whose memory is used directly.
+# The argument types check the dtype and the memory layout of the arrays at each call.
+_int_array = np.ctypeslib.ndpointer(dtype=_int, flags="C_CONTIGUOUS")
+_short_array = np.ctypeslib.ndpointer(dtype=_short, flags="C_CONTIGUOUS")
+_double_array = np.ctypeslib.ndpointer(dtype=c_double, flags="C_CONTIGUOUS")
+_pointer_array = np.ctypeslib.ndpointer(dtype=_pointer, flags="C_CONTIGUOUS")
+
 libangular_correlation.create_angular_correlation.restype = c_void_p
 libangular_correlation.create_angular_correlation.argtypes = [
     c_size_t,  # Number of cascade steps
-    POINTER(c_int),  # Angular momenta
-    POINTER(c_short),  # Parities
-    POINTER(c_short),  # EM characters
-    POINTER(c_int),  # Multipolarities
-    POINTER(c_short),  # Alternative EM characters
-    POINTER(c_int),  # Alternative multipolarities
-    POINTER(c_double),  # Multipole mixing ratios
+    _int_array,  # Angular momenta
+    _short_array,  # Parities
+    _short_array,  # EM characters
+    _int_array,  # Multipolarities
+    _short_array,  # Alternative EM characters
+    _int_array,  # Alternative multipolarities
+    _double_array,  # Multipole mixing ratios
 ]
 
 libangular_correlation.create_angular_correlation_with_transition_inference.restype = (
@@ -44,8 +60,13 @@ libangular_correlation.create_angular_correlation_with_transition_inference.rest
 )
 libangular_correlation.create_angular_correlation_with_transition_inference.argtypes = [
     c_size_t,  # Number of cascade steps
-    POINTER(c_int),  # Angular momenta
-    POINTER(c_short),  # Parities
+    _int_array,  # Angular momenta
+    _short_array,  # Parities
+]
+
+libangular_correlation.set_deltas_angular_correlation.argtypes = [
+    c_void_p,  # Pointer to AngularCorrelation object
+    _double_array,  # Multipole mixing ratios
 ]
 
 libangular_correlation.free_angular_correlation.argtypes = [
@@ -54,31 +75,156 @@ libangular_correlation.free_angular_correlation.argtypes = [
 
 libangular_correlation.get_em_char.argtypes = [
     c_void_p,  # Pointer to AngularCorrelation object
-    POINTER(c_short),  # Array that contains the results
+    _short_array,  # Array that contains the results
 ]
 
 libangular_correlation.get_two_L.argtypes = [
     c_void_p,  # Pointer to AngularCorrelation object
-    POINTER(c_int),  # Array that contains the results
+    _int_array,  # Array that contains the results
+]
+
+libangular_correlation.evaluate_angular_correlation_scalar.restype = c_double
+libangular_correlation.evaluate_angular_correlation_scalar.argtypes = [
+    c_void_p,  # Pointer to AngularCorrelation object
+    c_double,  # Polar angle theta
+    c_double,  # Azimuthal angle phi
 ]
 
 libangular_correlation.evaluate_angular_correlation.argtypes = [
     c_void_p,  # Pointer to AngularCorrelation object
     c_size_t,  # Number of angles
-    POINTER(c_double),  # Polar angle theta
-    POINTER(c_double),  # Azimuthal angle phi
-    POINTER(c_double),  # Array that contains the results
+    _double_array,  # Polar angle theta
+    _double_array,  # Azimuthal angle phi
+    _double_array,  # Array that contains the results
+]
+
+libangular_correlation.evaluate_angular_correlation_grid.argtypes = [
+    c_void_p,  # Pointer to AngularCorrelation object
+    c_size_t,  # Number of polar angles
+    _double_array,  # Polar angles theta
+    c_size_t,  # Number of azimuthal angles
+    _double_array,  # Azimuthal angles phi
+    _double_array,  # Array that contains the results
+]
+
+libangular_correlation.evaluate_angular_correlation_multi.argtypes = [
+    _pointer_array,  # Pointers to AngularCorrelation objects
+    c_size_t,  # Number of AngularCorrelation objects
+    c_size_t,  # Number of angles
+    _double_array,  # Polar angles theta
+    _double_array,  # Azimuthal angles phi
+    _double_array,  # Array that contains the results
 ]
 
 libangular_correlation.evaluate_angular_correlation_rotated.argtypes = [
     c_void_p,  # Pointer to AngularCorrelation object
     c_size_t,  # Number of angles
-    POINTER(c_double),  # Polar angle theta
-    POINTER(c_double),  # Azimuthal angle phi
-    POINTER(c_double),  # Euler angles Phi, Theta, and Psi
-    POINTER(c_double),  # Array that contains the results
+    _double_array,  # Polar angle theta
+    _double_array,  # Azimuthal angle phi
+    _double_array,  # Euler angles Phi, Theta, and Psi
+    _double_array,  # Array that contains the results
 ]
 
+libangular_correlation.evaluate_analyzing_power.argtypes = [
+    c_void_p,  # Pointer to AngularCorrelation object
+    c_size_t,  # Number of angles
+    _double_array,  # Polar angle theta
+    _double_array,  # Polar angle theta prime
+    _double_array,  # Azimuthal angle phi
+    _double_array,  # Azimuthal angle phi prime
+    c_double,  # Prefactor of the analyzing power
+    _double_array,  # Array that contains the results
+]
+
+libangular_correlation.evaluate_angular_correlation_delta_scan.argtypes = [
+    c_size_t,  # Number of cascade steps
+    _int_array,  # Angular momenta
+    _short_array,  # Parities
+    _short_array,  # EM characters
+    _int_array,  # Multipolarities
+    _short_array,  # Alternative EM characters
+    _int_array,  # Alternative multipolarities
+    c_size_t,  # Number of sets of multipole mixing ratios
+    _double_array,  # Multipole mixing ratios, one set after the other
+    c_size_t,  # Number of angles
+    _double_array,  # Polar angle theta
+    _double_array,  # Azimuthal angle phi
+    _double_array,  # Array that contains the results
+]
+
+
+def _state_arrays(initial_state, states):
+    """Return the arrays of angular momenta and parities of a cascade
+
+    The arrays have the dtypes expected by the C++ code.
+    """
+    two_J = np.array(
+        [initial_state.two_J] + [state.two_J for state in states], dtype=_int
+    )
+    par = np.array(
+        [initial_state.parity] + [state.parity for state in states], dtype=_short
+    )
+    return two_J, par
+
+
+def _transition_arrays(transitions):
+    """Return the arrays of EM characters, multipolarities, and mixing ratios of a cascade
+
+    All properties are collected in a single pass over the transitions.
+    The arrays have the dtypes expected by the C++ code.
+    """
+    em_char, two_L, em_charp, two_Lp, delta = zip(
+        *((t.em_char, t.two_L, t.em_charp, t.two_Lp, t.delta) for t in transitions)
+    )
+    return (
+        np.array(em_char, dtype=_short),
+        np.array(two_L, dtype=_int),
+        np.array(em_charp, dtype=_short),
+        np.array(two_Lp, dtype=_int),
+        np.array(delta, dtype=np.float64),
+    )
+
+
+# Minimum number of angles per thread in AngularCorrelation.evaluate. For smaller arrays, the
+# overhead of starting threads exceeds the time needed for the evaluation.
+_MIN_ANGLES_PER_THREAD = 10000
+
+# Minimum number of sets of mixing ratios per thread in AngularCorrelation.evaluate_delta_scan.
+# Each thread creates its own C++ AngularCorrelation object and tabulates the angular functions,
+# which takes about as long as the evaluation of a few ten sets of mixing ratios. Together with
+# the overhead of starting threads, this is only amortized for large scans.
+_MIN_DELTAS_PER_THREAD = 1000
+
+
+def _evaluate_in_threads(evaluate_range, n, n_threads, min_per_thread=1):
+    """Split the indices 0, ..., n-1 into contiguous ranges that are evaluated in parallel
+
+    Since ctypes releases the global interpreter lock during the call of the C++ code, functions
+    which call the C++ code for a range of indices can be evaluated in parallel threads.
+
+    Parameters
+    ----------
+    evaluate_range: callable
+        Function with the signature evaluate_range(start, stop), which evaluates the indices
+        start, ..., stop-1.
+    n: int
+        Number of indices.
+    n_threads: int or None
+        Maximum number of threads (None: the number of processors given by `os.cpu_count()`).
+    min_per_thread: int
+        Minimum number of indices per thread (default: 1).
+    """
+    if n_threads is None:
+        n_threads = os.cpu_count() or 1
+    n_threads = max(min(n_threads, n // min_per_thread), 1)
+    if n_threads == 1:
+        evaluate_range(0, n)
+    else:
+        bounds = np.linspace(0, n, n_threads + 1).astype(int)
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            # Consume the iterator to propagate exceptions from the threads.
+            list(executor.map(evaluate_range, bounds[:-1], bounds[1:]))
+
 
 class AngularCorrelation:
     r"""Class for a gamma-gamma correlation.
@@ -212,9 +358,11 @@ class AngularCorrelation:
         The first and the last transition of this list are assumed to be observed.
     angular_correlation: c_void_p
         Pointer to internal AngularCorrelation C++ object.
+    n_threads: int or None
+        Maximum number of threads used by `AngularCorrelation.evaluate`.
     """
 
-    def __init__(self, initial_state, cascade_steps):
+    def __init__(self, initial_state, cascade_steps, n_threads=None):
         """Constructor
 
         Parameters
@@ -225,80 +373,96 @@ class AngularCorrelation:
             Cascade steps, given as a list of arbitrary length which contains Transition-State pairs or State objects.
             The first and the last transition of this list are assumed to be observed.
             If no transition information is given, the most likely transitions (lowest multipole order, no mixing) are assumed to connect the given states.
+        n_threads: int or None
+            Maximum number of threads among which large arrays of angles are split by
+            `AngularCorrelation.evaluate` (default: None, i.e. the number of processors).
+            Each thread evaluates at least 10000 angles.
         """
 
         self.initial_state = initial_state
+        self.n_threads = n_threads
         self.angular_correlation = None
         self.n_cas_ste = len(cascade_steps)
 
+        # The properties of the cascade are stored as a 'structure of arrays', i.e. one numpy
+        # array per property, whose memory can be passed directly to the C++ code.
+        states = (
+            cascade_steps
+            if isinstance(cascade_steps[0], State)
+            else [cas_ste[1] for cas_ste in cascade_steps]
+        )
+        self.two_J, self.par = _state_arrays(initial_state, states)
+
         if isinstance(cascade_steps[0], State):
-            two_J = [cas_ste.two_J for cas_ste in cascade_steps]
-            two_J.insert(0, initial_state.two_J)
-            two_J = (c_int * len(two_J))(*two_J)
-            par = [cas_ste.parity for cas_ste in cascade_steps]
-            par.insert(0, initial_state.parity)
-            par = (c_short * len(par))(*par)
             self.angular_correlation = libangular_correlation.create_angular_correlation_with_transition_inference(
-                self.n_cas_ste, two_J, par
+                self.n_cas_ste,
+                self.two_J,
+                self.par,
             )
 
-            em_char = (c_short * self.n_cas_ste)()
-            libangular_correlation.get_em_char(self.angular_correlation, em_char)
-            two_L = (c_int * self.n_cas_ste)()
-            libangular_correlation.get_two_L(self.angular_correlation, two_L)
-            self.cascade_steps = []
-            for i in range(self.n_cas_ste):
-                em_charp = EM_UNKNOWN
-                if em_char[i] == MAGNETIC:
-                    em_charp = ELECTRIC
-                elif em_char[i] == ELECTRIC:
-                    em_charp = MAGNETIC
-
-                self.cascade_steps.append(
-                    [
-                        Transition(em_char[i], two_L[i], em_charp, two_L[i] + 2, 0.0),
-                        cascade_steps[i],
-                    ]
-                )
-
-            two_Lp = [tL + 2 for tL in two_L]
-            delta = [0.0] * self.n_cas_ste
+            self.em_char = np.zeros(self.n_cas_ste, dtype=_short)
+            libangular_correlation.get_em_char(self.angular_correlation, self.em_char)
+            self.two_L = np.zeros(self.n_cas_ste, dtype=_int)
+            libangular_correlation.get_two_L(self.angular_correlation, self.two_L)
+            self.em_charp = np.full(self.n_cas_ste, EM_UNKNOWN, dtype=_short)
+            self.em_charp[self.em_char == MAGNETIC] = ELECTRIC
+            self.em_charp[self.em_char == ELECTRIC] = MAGNETIC
+            self.two_Lp = self.two_L + 2
+            self.delta = np.zeros(self.n_cas_ste)
+
+            self.cascade_steps = [
+                [
+                    Transition(
+                        int(self.em_char[i]),
+                        int(self.two_L[i]),
+                        int(self.em_charp[i]),
+                        int(self.two_Lp[i]),
+                        0.0,
+                    ),
+                    cascade_steps[i],
+                ]
+                for i in range(self.n_cas_ste)
+            ]
 
         else:
-            two_J = [cas_ste[1].two_J for cas_ste in cascade_steps]
-            two_J.insert(0, initial_state.two_J)
-            two_J = (c_int * len(two_J))(*two_J)
-            par = [cas_ste[1].parity for cas_ste in cascade_steps]
-            par.insert(0, initial_state.parity)
-            par = (c_short * len(par))(*par)
-
-            em_char = [cas_ste[0].em_char for cas_ste in cascade_steps]
-            em_char = (c_short * len(em_char))(*em_char)
-            two_L = [cas_ste[0].two_L for cas_ste in cascade_steps]
-            two_L = (c_int * len(two_L))(*two_L)
-            em_charp = [cas_ste[0].em_charp for cas_ste in cascade_steps]
-            em_charp = (c_short * len(em_charp))(*em_charp)
-            two_Lp = [cas_ste[0].two_Lp for cas_ste in cascade_steps]
-            two_Lp = (c_int * len(two_Lp))(*two_Lp)
-            delta = [cas_ste[0].delta for cas_ste in cascade_steps]
-            delta = (c_double * len(delta))(*delta)
+            (
+                self.em_char,
+                self.two_L,
+                self.em_charp,
+                self.two_Lp,
+                self.delta,
+            ) = _transition_arrays(cas_ste[0] for cas_ste in cascade_steps)
 
             self.angular_correlation = (
                 libangular_correlation.create_angular_correlation(
-                    self.n_cas_ste, two_J, par, em_char, two_L, em_charp, two_Lp, delta
+                    self.n_cas_ste, *self._cascade_arrays(), self.delta
                 )
             )
             self.cascade_steps = cascade_steps
 
-        self.two_J = two_J
-        self.par = par
-        self.em_char = em_char
-        self.two_L = two_L
-        self.em_charp = em_charp
-        self.two_Lp = two_Lp
-        self.delta = delta
+        # The C++ object is deleted when this object is garbage collected, unless free() was
+        # called before.
+        self._finalizer = weakref.finalize(
+            self,
+            libangular_correlation.free_angular_correlation,
+            self.angular_correlation,
+        )
+
+    def _cascade_arrays(self):
+        """Return the arrays of angular momenta, parities, EM characters, and multipolarities
 
-    def __call__(self, theta, phi, Phi_Theta_Psi=None, *delta):
+        The arrays are given in the order which is expected by the C++ code.
+        """
+        return (
+            self.two_J,
+            self.par,
+            self.em_char,
+            self.two_L,
+            self.em_charp,
+            self.two_Lp,
+        )
+
+    def __call__(self, theta, phi, Phi_Theta_Psi=None, *delta, grid=False):
         r"""Evaluate the angular correlation
 
         This function accepts more parameters than the two angles in spherical coordinates:
@@ -319,8 +483,8 @@ class AngularCorrelation:
         assumed to be zero.
         If the list is longer than the number of cascade steps, the unnecessary deltas at the
         end of the list will be ignored.
-        Note that using the variable-length argument delta causes the creation of a new
-        AngularCorrelation object internally.
+        Note that using the variable-length argument delta changes the mixing ratios of the
+        internal AngularCorrelation object.
         This means that the following code raises no error if delta_1 is not equal to delta_2:
 
         ::
@@ -339,6 +503,11 @@ class AngularCorrelation:
             Euler angles \f$\Phi\f$, \f$\Theta\f$, and \f$\Psi\f$ in radians (default: None, i.e. no rotation).
         *delta: tuple of float
             Multipole mixing ratios in the convention of Biedenharn [default: empty tuple (), i.e. use previously set mixing ratios].
+        grid: bool
+            If True, theta and phi are interpreted as the axes of a grid of M polar and N
+            azimuthal angles, and the angular correlation is evaluated with
+            AngularCorrelation.evaluate_grid() (default: False).
+            A rotation is not supported in this case.
 
         Returns
         -------
@@ -347,45 +516,47 @@ class AngularCorrelation:
             correlation. If the values for theta and phi were scalars, a scalar will be returned.
             If at least one or both of theta and phi was a numpy array of shape (M, N, ...), a
             numpy array of shape (M, N, ...) will be returned.
+            If grid is True, an array of shape (M, N) will be returned.
+            The calculation is always done in double precision, i.e. the result has the dtype
+            np.float64 independent of the dtype of the input.
+
+        Raises
+        ------
+        ValueError
+            If grid is True and Euler angles are given.
         """
 
+        if grid and Phi_Theta_Psi is not None:
+            raise ValueError(
+                "The evaluation on a grid of angles does not support a rotation."
+            )
+
         n_delta = len(delta)
         if n_delta:
-            delta_values = [0.0] * self.n_cas_ste
             if n_delta < self.n_cas_ste:
                 warnings.warn(
                     "Number of multipole-mixing ratios ({:d}) is smaller than the number of cascade steps ({:d}). Assuming that the last {:d} transition(s) is/are pure.".format(
                         n_delta, self.n_cas_ste, self.n_cas_ste - n_delta
                     )
                 )
-                for i in range(n_delta):
-                    delta_values[i] = delta[i]
-
             elif len(delta) > len(self.cascade_steps):
                 warnings.warn(
                     "Number of multipole-mixing ratios ({:d}) is larger than the number of cascade steps ({:d}). Using only the first {:d} mixing ratios.".format(
                         n_delta, self.n_cas_ste, n_delta
                     )
                 )
-                delta_values = delta[: self.n_cas_ste]
-            else:
-                delta_values = [d for d in delta]
 
-            delta_values = (c_double * len(delta_values))(*delta_values)
-            self.angular_correlation = (
-                libangular_correlation.create_angular_correlation(
-                    self.n_cas_ste,
-                    self.two_J,
-                    self.par,
-                    self.em_char,
-                    self.two_L,
-                    self.em_charp,
-                    self.two_Lp,
-                    delta_values,
-                )
+            # The mixing ratios are written into the existing array, which is passed to the C++
+            # code without a copy.
+            n_used = min(n_delta, self.n_cas_ste)
+            self.delta[:n_used] = delta[:n_used]
+            self.delta[n_used:] = 0.0
+            libangular_correlation.set_deltas_angular_correlation(
+                self._checked_pointer(), self.delta
             )
-            self.delta = delta_values
 
+        if grid:
+            return self.evaluate_grid(theta, phi)
         return self.evaluate(theta, phi, Phi_Theta_Psi)
 
     def evaluate(self, theta, phi, Phi_Theta_Psi):
@@ -395,6 +566,7 @@ class AngularCorrelation:
         Arbitrary-dimension arrays are accepted for the azimuthal and polar angle, as long as
         both have the same shape.
         The loop over the set of values for theta and phi is done by the C++ code.
+        Large arrays are split among several threads (see the n_threads attribute).
         This function only reshapes the input arrays into 1D vectors that can be passed in a
         simple way to C++ code, and reshapes the result back to the original shape.
         Since AngularCorrelation.__call__() calls AngularCorrelation.evaluate(), it should never
@@ -416,78 +588,246 @@ class AngularCorrelation:
             correlation. If the values for theta and phi were scalars, a scalar will be returned.
             If at least one or both of theta and phi was a numpy array of shape (M, N, ...), a
             numpy array of shape (M, N, ...) will be returned.
+            The calculation is always done in double precision, i.e. the result has the dtype
+            np.float64 independent of the dtype of the input.
         """
-        theta_reshape = None
-        phi_reshape = None
-        original_shape = None
-        scalar_output = False
-
-        if isinstance(theta, (int, float)):
-            if isinstance(phi, (int, float)):
-                theta_reshape = np.array([theta])
-                phi_reshape = np.array([phi])
-                scalar_output = True
-            elif isinstance(phi, np.ndarray):
-                theta_reshape = theta * np.ones(np.size(phi))
-        else:
-            if isinstance(phi, np.ndarray):
-                theta_shape = np.shape(theta)
-                phi_shape = np.shape(phi)
-                if len(theta_shape) != len(phi_shape):
-                    raise ValueError(
-                        "theta and phi must have the same shape if both are ndarray objects."
-                    )
-                for i in range(len(theta_shape)):
-                    if theta_shape[i] != phi_shape[i]:
-                        raise ValueError(
-                            "theta and phi must have the same shape if both are ndarray objects."
-                        )
+        # A single pair of angles is passed by value, which avoids the creation of arrays.
+        if (
+            Phi_Theta_Psi is None
+            and isinstance(theta, (int, float))
+            and isinstance(phi, (int, float))
+        ):
+            return libangular_correlation.evaluate_angular_correlation_scalar(
+                self._checked_pointer(), theta, phi
+            )
 
-            theta_reshape = np.reshape(theta, (1, np.size(theta)))[0]
-            original_shape = np.shape(theta)
+        theta = np.asarray(theta, dtype=np.float64)
+        phi = np.asarray(phi, dtype=np.float64)
+        if theta.ndim > 0 and phi.ndim > 0 and theta.shape != phi.shape:
+            raise ValueError(
+                "theta and phi must have the same shape if both are ndarray objects."
+            )
+        # Scalar input is broadcast to the shape of the other argument.
+        theta_broadcast, phi_broadcast = np.broadcast_arrays(theta, phi)
+        original_shape = theta_broadcast.shape
+        scalar_output = theta_broadcast.ndim == 0
+
+        # The angles are converted to contiguous double-precision arrays, whose memory can be
+        # passed to the C++ code directly. Arrays that already have this layout are not copied.
+        theta_reshape = np.ascontiguousarray(theta_broadcast.ravel())
+        phi_reshape = np.ascontiguousarray(phi_broadcast.ravel())
+        size = len(theta_reshape)
+        result = np.empty(size)
+        if Phi_Theta_Psi is not None:
+            Phi_Theta_Psi = np.array(Phi_Theta_Psi, dtype=np.float64)
+        angular_correlation = self._checked_pointer()
+
+        def evaluate_range(start, stop):
+            # Slices of the contiguous 1D arrays are contiguous as well.
+            if Phi_Theta_Psi is None:
+                libangular_correlation.evaluate_angular_correlation(
+                    angular_correlation,
+                    stop - start,
+                    theta_reshape[start:stop],
+                    phi_reshape[start:stop],
+                    result[start:stop],
+                )
+            else:
+                libangular_correlation.evaluate_angular_correlation_rotated(
+                    angular_correlation,
+                    stop - start,
+                    theta_reshape[start:stop],
+                    phi_reshape[start:stop],
+                    Phi_Theta_Psi,
+                    result[start:stop],
+                )
 
-        if isinstance(phi, (int, float)) and isinstance(theta, np.ndarray):
-            phi_reshape = phi * np.ones(np.size(theta))
-        else:
-            phi_reshape = np.reshape(phi, (1, np.size(phi)))[0]
-            original_shape = np.shape(phi)
+        _evaluate_in_threads(
+            evaluate_range, size, self.n_threads, _MIN_ANGLES_PER_THREAD
+        )
+        if scalar_output:
+            return float(result[0])
+        return np.reshape(result, original_shape)
 
-        size = len(theta_reshape)
-        result = (c_double * size)()
-        if Phi_Theta_Psi is None:
-            libangular_correlation.evaluate_angular_correlation(
-                self.angular_correlation,
-                size,
-                (c_double * size)(*theta_reshape),
-                (c_double * size)(*phi_reshape),
-                result,
+    def evaluate_grid(self, theta, phi):
+        r"""Evaluate the angular correlation on a grid of polar and azimuthal angles
+
+        The result is the same as the one of AngularCorrelation.evaluate() for the arrays
+        returned by np.meshgrid(theta, phi, indexing="ij").
+        However, the loop over the grid is done by the C++ code, which evaluates the terms that
+        only depend on the polar angle once for each value of theta.
+        No arrays with the size of the grid need to be created for the angles.
+
+        Parameters
+        ----------
+        theta: (M,) ndarray or list of float
+            Polar angles in spherical coordinates in radians (\f$\theta \in \left[ 0, \pi \right]\f$).
+        phi: (N,) ndarray or list of float
+            Azimuthal angles in spherical coordinates in radians (\f$\varphi \in \left[ 0, 2 \pi \right]\f$).
+
+        Returns
+        -------
+        (M, N) ndarray
+            \f$W_{\gamma \gamma} \left( \theta_i, \varphi_j \right)\f$, where the polar angle
+            varies along the rows and the azimuthal angle along the columns.
+
+        Raises
+        ------
+        ValueError
+            If theta or phi have more than one dimension.
+        """
+        if np.ndim(theta) > 1 or np.ndim(phi) > 1:
+            raise ValueError(
+                "theta and phi must be one-dimensional for the evaluation on a grid."
             )
-        else:
-            libangular_correlation.evaluate_angular_correlation_rotated(
-                self.angular_correlation,
-                size,
-                (c_double * size)(*theta_reshape),
-                (c_double * size)(*phi_reshape),
-                (c_double * 3)(*Phi_Theta_Psi),
-                result,
+        theta = np.ascontiguousarray(np.ravel(theta), dtype=np.float64)
+        phi = np.ascontiguousarray(np.ravel(phi), dtype=np.float64)
+        result = np.empty((len(theta), len(phi)))
+        libangular_correlation.evaluate_angular_correlation_grid(
+            self._checked_pointer(),
+            len(theta),
+            theta,
+            len(phi),
+            phi,
+            result,
+        )
+        return result
+
+    def evaluate_delta_scan(self, delta, theta, phi, n_threads=None):
+        r"""Evaluate the angular correlation for many sets of multipole mixing ratios
+
+        The cascade of this object is evaluated for each row of `delta` at the same set of
+        angles.
+        In contrast to calling the object with the variable-length argument delta, the loop over
+        the mixing ratios is done by the C++ code, and no AngularCorrelation objects need to be
+        created (and freed) in Python.
+        The mixing ratios of this object are not changed.
+        Since ctypes releases the global interpreter lock during the call of the C++ code, the
+        rows of `delta` are split among several threads that are evaluated in parallel.
+
+        Parameters
+        ----------
+        delta: ndarray
+            Multipole mixing ratios in the convention of Biedenharn, array of shape
+            (N, n_cas_ste), where n_cas_ste is the number of cascade steps.
+        theta: ndarray
+            Polar angles in spherical coordinates in radians, array of shape (M,).
+        phi: ndarray
+            Azimuthal angles in spherical coordinates in radians, array of shape (M,).
+        n_threads: int
+            Maximum number of threads (default: None, i.e. the number of processors given by
+            `os.cpu_count()`).
+            At most one thread per 1000 rows of `delta` is used, so smaller scans are evaluated
+            without starting threads.
+
+        Returns
+        -------
+        ndarray
+            \f$W_{\gamma \gamma} \left( \theta, \varphi \right)\f$, array of shape (N, M).
+        """
+        delta = np.ascontiguousarray(delta, dtype=np.float64)
+        if delta.ndim != 2 or delta.shape[1] != self.n_cas_ste:
+            raise ValueError(
+                "delta must have the shape (N, {:d}), where {:d} is the number of cascade steps.".format(
+                    self.n_cas_ste, self.n_cas_ste
+                )
             )
-        if scalar_output:
-            return result[0]
-        return np.reshape(np.array(result), original_shape)
+        theta = np.ascontiguousarray(theta, dtype=np.float64).ravel()
+        phi = np.ascontiguousarray(phi, dtype=np.float64).ravel()
+        if len(theta) != len(phi):
+            raise ValueError("theta and phi must have the same number of elements.")
+
+        result = np.empty((len(delta), len(theta)))
+        cascade_arrays = self._cascade_arrays()
+
+        def evaluate_rows(start, stop):
+            # Consecutive rows of the C-contiguous arrays delta and result are contiguous as well.
+            libangular_correlation.evaluate_angular_correlation_delta_scan(
+                self.n_cas_ste,
+                *cascade_arrays,
+                stop - start,
+                delta[start:stop],
+                len(theta),
+                theta,
+                phi,
+                result[start:stop],
+            )
+
+        _evaluate_in_threads(
+            evaluate_rows, len(delta), n_threads, _MIN_DELTAS_PER_THREAD
+        )
+        return result
+
+    @classmethod
+    def evaluate_batch(cls, angular_correlations, theta, phi):
+        r"""Evaluate several angular correlations at the same set of angles
+
+        In contrast to calling each object separately, all angular correlations are evaluated
+        with a single call of the C++ code.
+
+        Parameters
+        ----------
+        angular_correlations: list of AngularCorrelation
+            K angular correlations.
+        theta: ndarray
+            Polar angles in spherical coordinates in radians, array of shape (M,).
+        phi: ndarray
+            Azimuthal angles in spherical coordinates in radians, array of shape (M,).
+
+        Returns
+        -------
+        ndarray
+            \f$W_{\gamma \gamma} \left( \theta, \varphi \right)\f$, array of shape (K, M).
+        """
+        theta = np.ascontiguousarray(theta, dtype=np.float64).ravel()
+        phi = np.ascontiguousarray(phi, dtype=np.float64).ravel()
+        if len(theta) != len(phi):
+            raise ValueError("theta and phi must have the same number of elements.")
+
+        handles = np.array(
+            [ang_cor._checked_pointer() for ang_cor in angular_correlations],
+            dtype=_pointer,
+        )
+        result = np.empty((len(handles), len(theta)))
+        libangular_correlation.evaluate_angular_correlation_multi(
+            handles, len(handles), len(theta), theta, phi, result
+        )
+        return result
 
     def free(self):
         """Free the memory occupied by the internal AngularCorrelation object
 
-        Since the AngularCorrelation C++ object owned by this class is a raw pointer, it needs to
-        be deleted explicitly to prevent significant memory leaking when many AngularCorrelation
-        objects are created (for example in the AnalyzingPower.evaluate method of the
-        corresponding module).
+        The AngularCorrelation C++ object owned by this class is a raw pointer.
+        It is deleted automatically when this object is garbage collected, but this function
+        allows to release the memory at a well-defined point.
         This function initiates the deletion of the pointer to the object in the C++ code (via a
         'delete' statement).
+        Calling it more than once has no effect.
         The AngularCorrelation object can not be used to calculate angular correlations any more
         after calling AngularCorrelation.free().
+        Methods that need the C++ object raise a ValueError instead.
         """
-        libangular_correlation.free_angular_correlation(self.angular_correlation)
+        self._finalizer()
+        self.angular_correlation = None
+
+    def _checked_pointer(self):
+        """Return the pointer to the internal AngularCorrelation object
+
+        Raises
+        ------
+        ValueError
+            If the object has been freed by AngularCorrelation.free().
+        """
+        if self.angular_correlation is None:
+            raise ValueError("AngularCorrelation has been freed.")
+        return self.angular_correlation
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Free the internal AngularCorrelation object at the end of a 'with' block"""
+        self.free()
 
 
 libangular_correlation.angular_correlation.restype = c_double
@@ -495,40 +835,32 @@ libangular_correlation.angular_correlation.argtypes = [
     c_double,  # Polar angle theta
     c_double,  # Azimuthal angle phi
     c_size_t,  # Number of cascade steps
-    POINTER(c_int),  # Angular momenta
-    POINTER(c_short),  # Parities
-    POINTER(c_short),  # EM characters
-    POINTER(c_int),  # Multipolarities
-    POINTER(c_short),  # Alternative EM characters
-    POINTER(c_int),  # Alternative multipolarities
-    POINTER(c_double),  # Multipole mixing ratios
-    POINTER(c_double),  # Euler angles Phi, Theta, and Psi
+    _int_array,  # Angular momenta
+    _short_array,  # Parities
+    _short_array,  # EM characters
+    _int_array,  # Multipolarities
+    _short_array,  # Alternative EM characters
+    _int_array,  # Alternative multipolarities
+    _double_array,  # Multipole mixing ratios
 ]
 
 
 def angular_correlation(theta, phi, initial_state, cascade_steps, Phi_Theta_Psi=None):
+    # The C function angular_correlation does not support a rotation of the coordinate system.
+    # Rotated angular correlations are evaluated by a temporary AngularCorrelation object.
+    if Phi_Theta_Psi is not None:
+        ang_cor = AngularCorrelation(initial_state, cascade_steps)
+        result = ang_cor(theta, phi, Phi_Theta_Psi)
+        ang_cor.free()
+        return result
+
     n_cas_ste = len(cascade_steps)
 
-    two_J = [cas_ste[1].two_J for cas_ste in cascade_steps]
-    two_J.insert(0, initial_state.two_J)
-    two_J = (c_int * len(two_J))(*two_J)
-    par = [cas_ste[1].parity for cas_ste in cascade_steps]
-    par.insert(0, initial_state.parity)
-    par = (c_short * len(par))(*par)
-
-    em_char = [cas_ste[0].em_char for cas_ste in cascade_steps]
-    em_char = (c_short * len(em_char))(*em_char)
-    two_L = [cas_ste[0].two_L for cas_ste in cascade_steps]
-    two_L = (c_int * len(two_L))(*two_L)
-    em_charp = [cas_ste[0].em_charp for cas_ste in cascade_steps]
-    em_charp = (c_short * len(em_charp))(*em_charp)
-    two_Lp = [cas_ste[0].two_Lp for cas_ste in cascade_steps]
-    two_Lp = (c_int * len(two_Lp))(*two_Lp)
-    delta = [cas_ste[0].delta for cas_ste in cascade_steps]
-    delta = (c_double * len(delta))(*delta)
-
-    if Phi_Theta_Psi is None:
-        Phi_Theta_Psi = (0.0, 0.0, 0.0)
+    two_J, par = _state_arrays(initial_state, [cas_ste[1] for cas_ste in cascade_steps])
+    em_char, two_L, em_charp, two_Lp, delta = _transition_arrays(
+        cas_ste[0] for cas_ste in cascade_steps
+    )
+
     return libangular_correlation.angular_correlation(
         theta,
         phi,
@@ -540,5 +872,4 @@ def angular_correlation(theta, phi, initial_state, cascade_steps, Phi_Theta_Psi=
         em_charp,
         two_Lp,
         delta,
-        (c_double * 3)(*Phi_Theta_Psi),
     )
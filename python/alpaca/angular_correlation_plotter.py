@@ -28,16 +28,24 @@ class AngularCorrelationPlotter:
         self, axis, Phi_Theta_Psi=None, n_points_per_dimension=100, max_abs_value=2.0
     ):
 
-        theta, phi = np.meshgrid(
-            np.linspace(0.0, np.pi, n_points_per_dimension),
-            np.linspace(0.0, 2.0 * np.pi, n_points_per_dimension),
-        )
+        # Rows of the grid correspond to the azimuthal angle, columns to the polar angle.
+        theta = np.linspace(0.0, np.pi, n_points_per_dimension)[np.newaxis, :]
+        phi = np.linspace(0.0, 2.0 * np.pi, n_points_per_dimension)[:, np.newaxis]
 
-        ang_cor = self.angular_correlation(theta, phi, Phi_Theta_Psi=Phi_Theta_Psi)
+        if Phi_Theta_Psi is None:
+            # The terms which only depend on the polar angle are evaluated only once per value
+            # of theta.
+            ang_cor = self.angular_correlation.evaluate_grid(theta[0], phi[:, 0]).T
+        else:
+            ang_cor = self.angular_correlation(
+                *np.broadcast_arrays(theta, phi), Phi_Theta_Psi=Phi_Theta_Psi
+            )
 
-        sine_theta = np.sin(theta)
-        x = ang_cor * sine_theta * np.cos(phi)
-        y = ang_cor * sine_theta * np.sin(phi)
+        # The trigonometric functions are evaluated for the 1D arrays of angles and broadcast
+        # to the grid.
+        ang_cor_sine_theta = ang_cor * np.sin(theta)
+        x = ang_cor_sine_theta * np.cos(phi)
+        y = ang_cor_sine_theta * np.sin(phi)
         z = ang_cor * np.cos(theta)
 
         color_map_max = np.max(ang_cor)
@@ -18,6 +18,76 @@
 import numpy as np
 
 
+def intersection_of_interval_arrays(intervals_1, intervals_2):
+    r"""Find the intersections of all intervals in an array with all intervals in another array
+
+    This function is the vectorized implementation of the other functions in this module.
+    The intervals of the second array are sorted by their lower limits once, and the running
+    maximum of their upper limits is tracked.
+    For each interval of the first array, two binary searches in these sorted arrays give the
+    range of candidate intervals of the second array that may intersect with it: all intervals
+    before the range end below its lower limit, and all intervals after the range start above
+    its upper limit.
+    The lower and upper limits of the intersections are calculated only for these candidates as
+    the maximum of the lower limits and the minimum of the upper limits, and only the pairs for
+    which the former is smaller than or equal to the latter are kept.
+    This reduces the cost per interval of the first array from :math:`\mathcal{O}(N)` to
+    :math:`\mathcal{O}(\log N + k)`, where :math:`k` is the number of candidates.
+
+    Parameters
+    ----------
+    intervals_1: (M, 2) ndarray or list of M lists of two float
+        First array of intervals. The single intervals may be unsorted.
+    intervals_2: (N, 2) ndarray or list of N lists of two float
+        Second array of intervals. The single intervals may be unsorted.
+
+    Returns
+    -------
+    (K, 2) ndarray
+        Nonempty intersections of each interval of the first array with each interval of the
+        second array, :math:`0 \leq K \leq M N`.
+        The intersections are sorted by the index in the first array and then by the index in
+        the second array.
+
+    Examples
+    --------
+    >>> intersection_of_interval_arrays([[0.0, 0.1], [0.6, 1.0]], [[0.3, 0.5], [0.8, 0.9]])
+    array([[0.8, 0.9]])
+    """
+    intervals_1 = np.sort(np.reshape(np.asarray(intervals_1, dtype=float), (-1, 2)))
+    intervals_2 = np.sort(np.reshape(np.asarray(intervals_2, dtype=float), (-1, 2)))
+
+    order = np.argsort(intervals_2[:, 0], kind="stable")
+    lower_limits_2 = intervals_2[order, 0]
+    upper_limits_2 = intervals_2[order, 1]
+    max_upper_limits_2 = np.maximum.accumulate(upper_limits_2)
+
+    first = np.searchsorted(max_upper_limits_2, intervals_1[:, 0], side="left")
+    last = np.maximum(
+        np.searchsorted(lower_limits_2, intervals_1[:, 1], side="right"), first
+    )
+    n_candidates = last - first
+
+    index_1 = np.repeat(np.arange(len(intervals_1)), n_candidates)
+    index_2 = np.arange(len(index_1)) + np.repeat(
+        first - np.cumsum(n_candidates) + n_candidates, n_candidates
+    )
+
+    lower_limits = np.maximum(intervals_1[index_1, 0], lower_limits_2[index_2])
+    upper_limits = np.minimum(intervals_1[index_1, 1], upper_limits_2[index_2])
+    nonempty = lower_limits <= upper_limits
+
+    # Restore the order of the second array among the intersections of each interval.
+    sorted_by_index = np.lexsort((order[index_2[nonempty]], index_1[nonempty]))
+
+    return np.column_stack(
+        (
+            lower_limits[nonempty][sorted_by_index],
+            upper_limits[nonempty][sorted_by_index],
+        )
+    )
+
+
 def intersection_of_two_intervals(interval_1, interval_2):
     r"""Find the intersection of two intervals
 
@@ -56,23 +126,17 @@ def intersection_of_two_intervals(interval_1, interval_2):
     >>> intersection_of_two_intervals([0.0, 1.0], [1.5, 2.0])
     []
     """
-    intersection = []
-
-    interval_1 = np.sort(interval_1)
-    interval_2 = np.sort(interval_2)
-
-    if interval_1[0] > interval_2[1]:
-        return []
-    elif interval_1[0] >= interval_2[0] and interval_1[0] <= interval_2[1]:
-        if interval_1[1] <= interval_2[1]:
-            return [interval_1[0], interval_1[1]]
-        else:
-            return [interval_1[0], interval_2[1]]
-    elif interval_1[1] >= interval_2[0]:
-        if interval_1[1] <= interval_2[1]:
-            return [interval_2[0], interval_1[1]]
-        else:
-            return [interval_2[0], interval_2[1]]
+    # For a single pair of intervals, plain Python comparisons are much faster than the
+    # array operations of intersection_of_interval_arrays.
+    lower_limit = max(
+        min(interval_1[0], interval_1[1]), min(interval_2[0], interval_2[1])
+    )
+    upper_limit = min(
+        max(interval_1[0], interval_1[1]), max(interval_2[0], interval_2[1])
+    )
+
+    if lower_limit <= upper_limit:
+        return [float(lower_limit), float(upper_limit)]
 
     return []
 
@@ -82,7 +146,8 @@ def intersection_of_interval_with_list_of_intervals(interval_1, list_of_interval
 
     Given an interval :math:`\left[ a, b \right]` and a set of intervals :math:`\left\{ \left[ c, d \right], \left[ e, f \right], ... \right \}`, this functions determines the intersections of the former with all elements of the latter.
 
-    See also `alpaca.analyzing_power.intersection_of_two_intervals`.
+    See also `alpaca.analyzing_power.intersection_of_two_intervals` and
+    `alpaca.interval_intersections.intersection_of_interval_arrays`.
 
     Parameters
     ----------
@@ -101,14 +166,7 @@ def intersection_of_interval_with_list_of_intervals(interval_1, list_of_interval
     >>> intersection_of_interval_with_list_of_intervals([0.0, 1.0], [[0.0, 0.5], [0.8, 1.5]])
     [[0.0, 0.5], [0.8, 1.0]]
     """
-    intersections = []
-
-    for interval in list_of_intervals:
-        intersection = intersection_of_two_intervals(interval_1, interval)
-        if len(intersection) > 0:
-            intersections.append(intersection)
-
-    return intersections
+    return intersection_of_interval_arrays([interval_1], list_of_intervals).tolist()
 
 
 def intersection(list_of_intervals_1, list_of_intervals_2):
@@ -135,14 +193,6 @@ def intersection(list_of_intervals_1, list_of_intervals_2):
     >>> intersection([[0.0, 0.1], [0.3, 0.4], [0.6, 1.0]], [[0.3, 0.5], [0.8, 0.9]])
     [[0.3, 0.4], [0.8, 0.9]]
     """
-    intersections = []
-
-    for interval_1 in list_of_intervals_1:
-        intersection = intersection_of_interval_with_list_of_intervals(
-            interval_1, list_of_intervals_2
-        )
-        if len(intersection) > 0:
-            for interval in intersection:
-                intersections.append(interval)
-
-    return intersections
+    return intersection_of_interval_arrays(
+        list_of_intervals_1, list_of_intervals_2
+    ).tolist()
@@ -29,15 +29,15 @@ def invert_grid(
 
     This functions inverts a one-dimensional function to find all input values that agree with
     a given range of output values.
-    It expects pairs of values :math:`x_i` and :math:`y_i` for :math:`0 < i < N-1`,
+    It expects pairs of values :math:`x_i` and :math:`y_i` for :math:`0 \leq i \leq N-1`,
     :math:`N > 0`, which are assumed to be evaluations of a function :math:`f`:
 
     ..math:: y_i = f(x_i)
 
     The function :math:`f` may be surjective, i.e. multiple values of :math:`x_i` may result in
     the same :math:`y_i`.
-    By looping through all pairs of values, this function finds all :math:`x_i` that result in
-    a function value in the given range :math:`\left[ y_0, y_1 \right]`.
+    By comparing all :math:`y_i` to the limits at once, this function finds all :math:`x_i` that
+    result in a function value in the given range :math:`\left[ y_0, y_1 \right]`.
     More precisely, this functions finds all :math:`x_i` that fulfil:
 
     ..math:: y_0 - \Delta y \leq \underbrace{f(x_i)}_{y_i} \leq y_1 + \Delta y
@@ -52,6 +52,8 @@ def invert_grid(
     assumed to be part of an interval on the real axis.
     An alternative return value of this function are therefore the intervals
     :math:`\left[ x_i, x_j \right]`.
+    The intervals are found from the rising and falling edges of the boolean array of matches,
+    without a loop over the grid.
 
     Parameters
     ----------
@@ -79,28 +81,111 @@ def invert_grid(
         shape (`numpy.shape`) `(len(x),)`
     """
 
+    x, fx = _check_grid(x, fx)
+
+    # Determine the limits of the range, including the tolerance, once before the comparison.
+    y_lower, y_upper = _limits(y, atol)
+    # Boolean mask of the matching values, which is used for indexing directly.
+    inequality = np.logical_and(fx >= y_lower, fx <= y_upper)
+
+    if return_intervals:
+        return _intervals(x, inequality)
+
+    return x[inequality]
+
+
+def invert_grid_batch(
+    x,
+    fx,
+    y,
+    atol=1e-3,
+    return_intervals=False,
+):
+    r"""Invert a function on a grid for several values or ranges of y at once
+
+    This function is equivalent to calling `invert_grid` for each element of `y`, but it
+    compares the function values with the limits of all ranges with a single broadcast
+    comparison.
+    It is intended for the inversion of several measured values with the same grid
+    :math:`\left\{ x_i, y_i \right\}`, which then needs to be evaluated only once.
+
+    Parameters
+    ----------
+    x, fx: (N,1) ndarray of float or list of float
+        Values of :math:`x_i` and :math:`y_i`. Both lists must have the same length.
+    y: list of K elements, each a float or a [float, float] range
+        :math:`K` values of :math:`y` or ranges. See `invert_grid`.
+        Note that a single range `[a, b]` is interpreted as two values `a` and `b`.
+        Pass `[[a, b]]` to invert a single range.
+    atol: float
+        :math:`\Delta y`, absolute tolerance for determining the numerical equality
+        (default: 0.001).
+    return_intervals: bool
+        Determines whether lists of :math:`x_i` (False) or lists of intervals (True)
+        should be returned (default: False).
+
+    Returns
+    -------
+    list of K lists of float or lists of [float, float]
+        Results of `invert_grid` for each element of `y`.
+
+    Raises
+    ------
+    ValueError
+        If `x` and `fx` do not have the same shape `(len(x),)`.
+
+    Examples
+    --------
+    >>> invert_grid_batch([0.0, 0.5, 1.0], [0.0, 0.5, 1.0], [0.5, [0.4, 1.2]])
+    [array([0.5]), array([0.5, 1. ])]
+    """
+    x, fx = _check_grid(x, fx)
+
+    limits = np.array([_limits(y_k, atol) for y_k in y], dtype=float).reshape(-1, 2)
+    # Boolean masks of the matching values, one row per element of y.
+    inequalities = np.logical_and(
+        fx >= limits[:, 0, np.newaxis], fx <= limits[:, 1, np.newaxis]
+    )
+
+    if return_intervals:
+        return [_intervals(x, inequality) for inequality in inequalities]
+
+    return [x[inequality] for inequality in inequalities]
+
+
+def _check_grid(x, fx):
+    """Check that x and fx are one-dimensional arrays of the same length
+
+    Returns
+    -------
+    (ndarray, ndarray)
+        x and fx as arrays.
+
+    Raises
+    ------
+    ValueError
+        If `x` and `fx` do not have the same shape `(len(x),)`.
+    """
     n_x = len(x)
     if np.shape(x) != (n_x,) or np.shape(fx) != (n_x,):
         raise ValueError("Both x and fx must be (N,1) arrays [np.shape(x) == (N,)].")
 
-    if isinstance(y, (int, float)):
-        y = [y, y]
-    if y[1] < y[0]:
-        y = [y[1], y[0]]
-    inequality = (fx >= y[0] - atol) * (fx <= y[1] + atol)
-    x_results = np.extract(inequality, x)
+    return np.asarray(x), np.asarray(fx)
 
-    if return_intervals:
-        intervals = []
-        interval_start = None
-        for i, matching in enumerate(inequality):
-            if matching and interval_start is None:
-                interval_start = x[i]
-            if not matching and interval_start is not None:
-                intervals.append([interval_start, x[i - 1]])
-                interval_start = None
-            if i == n_x - 1 and interval_start is not None:
-                intervals.append([interval_start, x[-1]])
-        return intervals
-
-    return x_results
+
+def _limits(y, atol):
+    """Lower and upper limit of a value or range of y, including the tolerance"""
+    if np.ndim(y) == 0:
+        return y - atol, y + atol
+    return min(y[0], y[1]) - atol, max(y[0], y[1]) + atol
+
+
+def _intervals(x, inequality):
+    """Find the intervals of x for which the boolean array inequality is True"""
+    # Find the runs of matching values from the rising and falling edges of the inequality.
+    # A rising edge marks the first matching value of an interval, and a falling edge the
+    # first value after it that does not match.
+    edges = np.diff(inequality.astype(np.int8), prepend=0, append=0)
+    return np.column_stack(
+        (x[np.flatnonzero(edges == 1)], x[np.flatnonzero(edges == -1) - 1])
+    ).tolist()
@@ -15,6 +15,9 @@
 
 # Copyright (C) 2021-2023 Udo Friman-Gayer
 
+import gc
+import warnings
+
 import pytest
 
 import numpy as np
@@ -42,6 +45,21 @@ def test_analyzing_power():
     with pytest.raises(ValueError):
         AnalyzingPower(ang_cor, PQ=2.0)
 
+    with pytest.raises(ValueError):
+        AnalyzingPower(ang_cor, convention="unknown")
+
+    # Test that an angular correlation that has been freed can not be evaluated.
+    ang_cor_freed = AngularCorrelation(
+        State(0, POSITIVE),
+        [
+            [Transition(ELECTRIC, 2, MAGNETIC, 4, 0.0), State(2, NEGATIVE)],
+            [Transition(ELECTRIC, 2, MAGNETIC, 4, 0.0), State(0, POSITIVE)],
+        ],
+    )
+    ang_cor_freed.free()
+    with pytest.raises(ValueError):
+        AnalyzingPower(ang_cor_freed)(0.5 * np.pi)
+
     ana_pow = AnalyzingPower(ang_cor, PQ=-0.9)
 
     assert np.isclose(ana_pow(0.5 * np.pi), 0.9)
@@ -50,6 +68,22 @@ def test_analyzing_power():
 
     assert np.isclose(ana_pow(0.5 * np.pi), 1.0)
 
+    # Test that changing PQ or the convention of an existing object updates the results,
+    # including cached ones.
+    ana_pow_2 = AnalyzingPower(ang_cor, convention="KPZ")
+    assert np.isclose(ana_pow_2.evaluate(0.0, [0.0, 0.0]), 1.0)
+    ana_pow_2.PQ = -0.9
+    assert np.isclose(ana_pow_2(0.5 * np.pi), -0.9)
+    assert np.isclose(ana_pow_2.evaluate(0.0, [0.0, 0.0]), -0.9)
+    ana_pow_2.convention = "natural"
+    assert np.isclose(ana_pow_2(0.5 * np.pi), 0.9)
+    with pytest.raises(ValueError):
+        ana_pow_2.PQ = 2.0
+    with pytest.raises(ValueError):
+        ana_pow_2.convention = "unknown"
+    assert ana_pow_2.PQ == -0.9
+    assert ana_pow_2.convention == "natural"
+
     # Test the arbitrary-angle input
 
     assert np.isclose(
@@ -58,6 +92,13 @@ def test_analyzing_power():
         / (ang_cor(0.1, 0.3) + ang_cor(0.2, 0.4)),
     )
 
+    # Test the array input, which is evaluated with a single call of the angular correlation.
+    theta = np.array([[0.1, 0.2], [0.3, 0.4]])
+    assert np.allclose(
+        ana_pow(theta),
+        [[ana_pow(0.1), ana_pow(0.2)], [ana_pow(0.3), ana_pow(0.4)]],
+    )
+
     # Test the arctan_grid function which creates an equidistant grid of arctan(delta) between two
     # limits.
     # In particular, test the warnings issued by this function.
@@ -70,6 +111,19 @@ def test_analyzing_power():
     assert np.allclose(
         grid, np.tan(np.linspace(np.arctan(-100.0), np.arctan(100.0), 4))
     )
+    assert np.array_equal(grid, -grid[::-1])
+    grid = arctan_grid(5)
+    assert grid[2] == 0.0
+    assert np.array_equal(grid, -grid[::-1])
+    assert grid[0] == -100.0
+    assert grid[-1] == 100.0
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert np.allclose(
+            arctan_grid(4, quiet=True),
+            np.tan(np.linspace(np.arctan(-100.0), np.arctan(100.0), 4)),
+        )
+        assert len(arctan_grid(1, quiet=True)) == 2
 
     # Test AnalyzingPower.evaluate for scalar input
     theta = 0.5 * np.pi
@@ -83,6 +137,9 @@ def test_analyzing_power():
     ana_pow = AnalyzingPower(ang_cor)
 
     assert ana_pow.evaluate(0.5, ["delta", "delta"], theta) == ana_pow(theta)
+    assert ana_pow.evaluate(np.float64(0.5), ["delta", "delta"], theta) == ana_pow(
+        theta
+    )
 
     # Test AnalyzingPower.evaluate for scalar input when the relation between mixing ratios
     # is an arbitrary function.
@@ -153,3 +210,84 @@ def test_analyzing_power():
     ).evaluate(np.array([[0.1, 0.2], [0.3, 0.4]]), [0.0, "delta"], theta=theta)
 
     assert np.allclose(ang_cor_matrix, ang_cor_matrix_manual)
+
+    # Test that cached results of AnalyzingPower.evaluate are neither changed by modifying a
+    # returned array nor by clearing the cache.
+    ana_pow = AnalyzingPower(ang_cor)
+    delta = np.array([0.1, 0.2])
+    ana_pow_cached = ana_pow.evaluate(delta, ["delta", 0.0])
+    ana_pow_cached[0] = 2.0
+    assert ana_pow.evaluate(delta, ["delta", 0.0])[0] != 2.0
+    ana_pow.clear_cache()
+    assert np.array_equal(
+        ana_pow.evaluate(delta, ["delta", 0.0]),
+        AnalyzingPower(ang_cor, cache_size=0).evaluate(delta, ["delta", 0.0]),
+    )
+
+    # Test that the least recently used results are discarded.
+    ana_pow_small_cache = AnalyzingPower(ang_cor, cache_size=1)
+    ana_pow_small_cache.evaluate(delta, ["delta", 0.0])
+    assert np.array_equal(
+        ana_pow_small_cache.evaluate(delta, [0.0, "delta"]),
+        ana_pow.evaluate(delta, [0.0, "delta"]),
+    )
+    assert len(ana_pow_small_cache._cache) == 1
+
+    # Test that the cache is cleared if the angular correlation is replaced.
+    ang_cor_other = AngularCorrelation(
+        State(0, POSITIVE),
+        [
+            [Transition(ELECTRIC, 2, MAGNETIC, 4, 0.0), State(2, NEGATIVE)],
+            [Transition(ELECTRIC, 2, MAGNETIC, 4, 0.0), State(4, POSITIVE)],
+        ],
+    )
+    ana_pow_replaced = AnalyzingPower(ang_cor)
+    ana_pow_replaced.evaluate(delta, ["delta", 0.0])
+    ana_pow_replaced.angular_correlation = ang_cor_other
+    assert np.array_equal(
+        ana_pow_replaced.evaluate(delta, ["delta", 0.0]),
+        AnalyzingPower(ang_cor_other).evaluate(delta, ["delta", 0.0]),
+    )
+
+    # Test that a temporary AnalyzingPower object and its angular correlation are deleted
+    # without the cyclic garbage collector, i.e. that the cache does not create a reference
+    # cycle.
+    gc.disable()
+    try:
+        ana_pow_temporary = AnalyzingPower(
+            AngularCorrelation(
+                State(0, POSITIVE),
+                [
+                    [Transition(ELECTRIC, 2, MAGNETIC, 4, 0.0), State(2, NEGATIVE)],
+                    [Transition(ELECTRIC, 2, MAGNETIC, 4, 0.0), State(0, POSITIVE)],
+                ],
+            )
+        )
+        ana_pow_temporary.evaluate(delta, ["delta", 0.0])
+        finalizer = ana_pow_temporary.angular_correlation._finalizer
+        del ana_pow_temporary
+        assert not finalizer.alive
+    finally:
+        gc.enable()
+
+    # Test that the analyzing power is broadcast if no mixing ratio depends on the variable.
+    ana_pow_fixed = ana_pow.evaluate(np.array([[0.1, 0.2, 0.3]]), [0.0, 0.5])
+    assert ana_pow_fixed.shape == (1, 3)
+    assert np.all(ana_pow_fixed == ana_pow.evaluate(0.0, [0.0, 0.5]))
+    assert np.array_equal(
+        ana_pow_fixed,
+        ana_pow.evaluate(np.array([[0.1, 0.2, 0.3]]), [0.0, lambda x: 0.5]),
+    )
+
+    # Test that the result does not depend on the number of threads.
+    assert np.array_equal(
+        ana_pow.evaluate(delta, ["delta", 0.0]),
+        AnalyzingPower(ang_cor, n_threads=1).evaluate(delta, ["delta", 0.0]),
+    )
+
+    # Test the evaluation on a grid of polar angles and mixing ratios.
+    theta = [0.25 * np.pi, 0.5 * np.pi, 0.75 * np.pi]
+    ana_pow_scan = ana_pow.scan(theta, delta, ["delta", 0.0])
+    assert ana_pow_scan.shape == (3, 2)
+    for i, t in enumerate(theta):
+        assert np.allclose(ana_pow_scan[i], ana_pow.evaluate(delta, ["delta", 0.0], t))
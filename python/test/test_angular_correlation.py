@@ -20,6 +20,9 @@
 # This is already done in the tests of the C++ code.
 # The purpose of this test is to ensure that the python API works correctly.
 
+import numpy as np
+import pytest
+
 from alpaca.angular_correlation import angular_correlation, AngularCorrelation
 from alpaca.state import POSITIVE, POSITIVE, State
 from alpaca.transition import ELECTRIC, MAGNETIC, Transition
@@ -37,6 +40,173 @@ def test_angular_correlation():
     assert ang_cor(0.1, 0.1) == angular_correlation(
         0.1, 0.1, initial_state, cascade_steps
     )
+
+    # Scalar angles are evaluated without creating arrays, with the same result.
+    assert ang_cor(0.1, 0.1) == ang_cor(np.array([0.1]), np.array([0.1]))[0]
+
+    # Input of a different dtype is converted to double precision.
+    theta = np.array([0.1, 0.2], dtype=np.float32)
+    assert ang_cor(theta, 0.1).dtype == np.float64
+    assert np.array_equal(ang_cor(theta, 0.1), ang_cor(theta.astype(np.float64), 0.1))
+
+    # Test the broadcasting of scalar angles.
+    assert np.array_equal(
+        ang_cor(theta, 0.1), ang_cor(theta, np.full(theta.shape, 0.1))
+    )
+    assert np.array_equal(
+        ang_cor(0.1, theta), ang_cor(np.full(theta.shape, 0.1), theta)
+    )
+
+    # Test the evaluation on a grid of angles.
+    theta = np.array([0.1, 0.2, 0.3])
+    phi = np.array([0.4, 0.5])
+    theta_grid, phi_grid = np.meshgrid(theta, phi, indexing="ij")
+    assert np.allclose(ang_cor(theta, phi, grid=True), ang_cor(theta_grid, phi_grid))
+    with pytest.raises(ValueError):
+        ang_cor(theta, phi, (0.1, 0.1, 0.1), grid=True)
+    with pytest.raises(ValueError):
+        ang_cor.evaluate_grid(theta_grid, phi)
+    # Test the evaluation of a rotated angular correlation for many angles at once.
+    # The Euler angles (0, theta, pi/2) rotate the z axis into the direction (theta, 0).
+    assert np.allclose(ang_cor(theta, theta, (0.0, 0.0, 0.0)), ang_cor(theta, theta))
+    assert np.allclose(
+        ang_cor(theta, np.zeros(3), (0.0, theta[1], 0.5 * np.pi))[1],
+        ang_cor(0.0, 0.0),
+    )
+    # Test that the result does not depend on the number of threads.
+    theta_many = np.linspace(0.0, np.pi, 20001)
+    assert np.array_equal(
+        AngularCorrelation(initial_state, cascade_steps, n_threads=2)(theta_many, 0.1),
+        AngularCorrelation(initial_state, cascade_steps, n_threads=1)(theta_many, 0.1),
+    )
+    assert np.array_equal(
+        AngularCorrelation(initial_state, cascade_steps, n_threads=2)(
+            theta_many, 0.1, (0.1, 0.2, 0.3)
+        ),
+        ang_cor(theta_many, 0.1, (0.1, 0.2, 0.3)),
+    )
+
+    # Test the evaluation of several angular correlations at once.
+    ang_cor_2 = AngularCorrelation(
+        initial_state,
+        [
+            [Transition(MAGNETIC, 2, ELECTRIC, 4, 0.0), State(2, POSITIVE)],
+            [Transition(MAGNETIC, 2, ELECTRIC, 4, -0.5), State(4, POSITIVE)],
+        ],
+    )
+    batch = AngularCorrelation.evaluate_batch([ang_cor, ang_cor_2], theta, theta)
+    assert batch.shape == (2, 3)
+    assert np.array_equal(batch[0], ang_cor(theta, theta))
+    assert np.array_equal(batch[1], ang_cor_2(theta, theta))
+    with pytest.raises(ValueError):
+        AngularCorrelation.evaluate_batch([ang_cor], theta, phi)
+    # Test that the C++ object is deleted exactly once, either by free() or when the object is
+    # garbage collected.
+    finalizer = ang_cor_2._finalizer
+    ang_cor_2.free()
+    assert not finalizer.alive
+    ang_cor_2.free()
+    finalizer = AngularCorrelation(initial_state, cascade_steps)._finalizer
+    assert not finalizer.alive
+    with AngularCorrelation(initial_state, cascade_steps) as ang_cor_3:
+        assert ang_cor_3(0.1, 0.1) == ang_cor(0.1, 0.1)
+    assert not ang_cor_3._finalizer.alive
+    # Test that a freed object can not be evaluated any more.
+    with pytest.raises(ValueError):
+        ang_cor_3(0.1, 0.1)
+    with pytest.raises(ValueError):
+        ang_cor_3(theta, theta)
+    with pytest.raises(ValueError):
+        ang_cor_3(theta, theta, (0.1, 0.1, 0.1))
+    with pytest.raises(ValueError):
+        ang_cor_3.evaluate_grid(theta, phi)
+    with pytest.raises(ValueError):
+        ang_cor_3(0.1, 0.1, None, 0.1, 0.2)
+    with pytest.raises(ValueError):
+        AngularCorrelation.evaluate_batch([ang_cor, ang_cor_3], theta, theta)
+
     assert ang_cor(0.1, 0.1, Phi_Theta_Psi=(0.1, 0.1, 0.1)) == angular_correlation(
         0.1, 0.1, initial_state, cascade_steps, Phi_Theta_Psi=(0.1, 0.1, 0.1)
     )
+    # The Euler angles (0, pi/2, 0) rotate the z axis into the -y axis and keep the x axis,
+    # i.e. the polarization axis, fixed.
+    # Therefore, the rotated correlation along the z axis is the original one along the y axis.
+    assert np.isclose(
+        ang_cor(0.0, 0.0, (0.0, 0.5 * np.pi, 0.0)), ang_cor(0.5 * np.pi, 0.5 * np.pi)
+    )
+    # A rotation by pi/2 around the z axis swaps the x and y axes.
+    assert np.isclose(
+        ang_cor(0.5 * np.pi, 0.0, (0.0, 0.0, 0.5 * np.pi)),
+        ang_cor(0.5 * np.pi, 0.5 * np.pi),
+    )
+    assert np.isclose(
+        ang_cor(0.5 * np.pi, 0.5 * np.pi, (0.0, 0.0, 0.5 * np.pi)),
+        ang_cor(0.5 * np.pi, 0.0),
+    )
+    # A rotation around the z axis by the angles Phi and Psi is equivalent to a shift of the
+    # azimuthal angle by -(Phi + Psi).
+    assert np.isclose(
+        angular_correlation(
+            0.3, 0.5, initial_state, cascade_steps, Phi_Theta_Psi=(0.1, 0.0, 0.2)
+        ),
+        ang_cor(0.3, 0.2),
+    )
+
+
+def test_angular_correlation_delta_scan():
+    initial_state = State(0, POSITIVE)
+    cascade_steps = [
+        [Transition(MAGNETIC, 2, ELECTRIC, 4, 0.0), State(2, POSITIVE)],
+        [Transition(MAGNETIC, 2, ELECTRIC, 4, 0.5), State(4, POSITIVE)],
+    ]
+    ang_cor = AngularCorrelation(initial_state, cascade_steps)
+
+    # Test the evaluation for many sets of multipole mixing ratios at once.
+    delta_scan = ang_cor.evaluate_delta_scan(
+        [[0.0, 0.5], [0.0, -0.5]], [0.1, 0.2], [0.1, 0.2]
+    )
+    assert delta_scan.shape == (2, 2)
+    assert delta_scan[0, 1] == ang_cor(0.2, 0.2)
+    assert delta_scan[1, 0] == angular_correlation(
+        0.1,
+        0.1,
+        initial_state,
+        [
+            [Transition(MAGNETIC, 2, ELECTRIC, 4, 0.0), State(2, POSITIVE)],
+            [Transition(MAGNETIC, 2, ELECTRIC, 4, -0.5), State(4, POSITIVE)],
+        ],
+    )
+
+    # Test that the result does not depend on the number of threads. The scan is large enough
+    # to be split among two threads.
+    delta_many = np.zeros((2001, 2))
+    delta_many[:, 1] = np.linspace(-1.0, 1.0, 2001)
+    assert np.array_equal(
+        ang_cor.evaluate_delta_scan(delta_many, [0.1, 0.2], [0.1, 0.2], n_threads=2),
+        ang_cor.evaluate_delta_scan(delta_many, [0.1, 0.2], [0.1, 0.2], n_threads=1),
+    )
+
+
+def test_angular_correlation_set_deltas():
+    initial_state = State(0, POSITIVE)
+    ang_cor = AngularCorrelation(
+        initial_state,
+        [
+            [Transition(MAGNETIC, 2, ELECTRIC, 4, 0.0), State(2, POSITIVE)],
+            [Transition(MAGNETIC, 2, ELECTRIC, 4, 0.5), State(4, POSITIVE)],
+        ],
+    )
+    ang_cor_ref = angular_correlation(
+        0.1,
+        0.1,
+        initial_state,
+        [
+            [Transition(MAGNETIC, 2, ELECTRIC, 4, 0.0), State(2, POSITIVE)],
+            [Transition(MAGNETIC, 2, ELECTRIC, 4, -0.5), State(4, POSITIVE)],
+        ],
+    )
+
+    # Test the evaluation with different multipole mixing ratios, which changes the mixing ratios
+    # of the object.
+    assert ang_cor(0.1, 0.1, None, 0.0, -0.5) == ang_cor_ref
+    assert ang_cor(0.1, 0.1) == ang_cor_ref
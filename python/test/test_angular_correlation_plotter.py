@@ -56,3 +56,8 @@ def test_angular_correlation_plotter():
                 r" $\leftarrow$ Polarization Plane $\rightarrow$", labelpad=-2
             )
         plt.savefig(ang_cor[0])
+
+        # Without a rotation, the angular correlation is evaluated on a grid of angles.
+        fig = plt.figure()
+        ang_cor_plot.plot(fig.add_subplot(projection="3d"))
+        plt.close(fig)
@@ -18,6 +18,7 @@
 import numpy as np
 
 from alpaca.interval_intersections import (
+    intersection_of_interval_arrays,
     intersection_of_two_intervals,
     intersection_of_interval_with_list_of_intervals,
     intersection,
@@ -88,3 +89,21 @@ def test_interval_intersections():
     assert np.allclose(intersection(b, a), [[0.3, 0.4], [0.8, 0.9]])
     assert np.allclose(intersection(a, a), a)
     assert np.allclose(intersection(b, b), b)
+
+    # Test the vectorized intersection of two arrays of intervals.
+    intersections = intersection_of_interval_arrays(np.array(a), np.array(b)[:, ::-1])
+    assert intersections.shape == (2, 2)
+    assert np.allclose(intersections, [[0.3, 0.4], [0.8, 0.9]])
+    assert intersection_of_interval_arrays(a, []).shape == (0, 2)
+
+    # Test the sorted-index search of intersection_of_interval_arrays against the intersections
+    # of all pairs of intervals, including nested and overlapping intervals in the second array.
+    a = [[0.05, 0.35], [0.45, 0.45], [1.0, 0.55], [1.2, 1.3]]
+    b = [[0.0, 0.9], [0.3, 0.1], [0.35, 0.4], [0.5, 0.6], [0.2, 0.3], [0.7, 1.1]]
+    intersections = [
+        intersection_of_two_intervals(a_i, b_j)
+        for a_i in a
+        for b_j in b
+        if len(intersection_of_two_intervals(a_i, b_j)) > 0
+    ]
+    assert np.array_equal(intersection_of_interval_arrays(a, b), intersections)
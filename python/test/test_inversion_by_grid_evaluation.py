@@ -19,7 +19,7 @@ import pytest
 
 import numpy as np
 
-from alpaca.inversion_by_grid_evaluation import invert_grid
+from alpaca.inversion_by_grid_evaluation import invert_grid, invert_grid_batch
 
 
 def linear(x):
@@ -77,3 +77,33 @@ def test_inversion_by_grid_evaluation():
     x_intervals = invert_grid(x, fx, [4.0, 1.0], return_intervals=True)
     assert len(x_intervals) == 2
     assert np.allclose(x_intervals, [[-2.0, -1.0], [1.0, 2.0]])
+
+    # Test that the upper limit of each interval is the last matching value, also for intervals
+    # that consist of a single grid point or cover the entire grid.
+    x_intervals = invert_grid(x, fx, [9.0, 9.0], atol=0.0, return_intervals=True)
+    assert np.allclose(x_intervals, [[-3.0, -3.0], [3.0, 3.0]])
+
+    x_intervals = invert_grid(x, fx, [0.0, 9.0], return_intervals=True)
+    assert np.allclose(x_intervals, [[-3.0, 3.0]])
+
+    # Test the inversion for several values and ranges of y at once.
+    y = [9.0, [4.0, 1.0], [0.0, 9.0], 10.0]
+    x_results = invert_grid_batch(x, fx, y)
+    assert len(x_results) == len(y)
+    for x_result, y_k in zip(x_results, y):
+        assert np.array_equal(x_result, invert_grid(x, fx, y_k))
+    x_intervals = invert_grid_batch(x, fx, y, return_intervals=True)
+    for x_interval, y_k in zip(x_intervals, y):
+        assert x_interval == invert_grid(x, fx, y_k, return_intervals=True)
+
+    # Test that a bare range [a, b] is treated as two separate values, unlike in invert_grid.
+    x_results = invert_grid_batch(x, fx, [4.0, 9.0])
+    assert len(x_results) == 2
+    assert np.array_equal(x_results[0], invert_grid(x, fx, 4.0))
+    assert np.array_equal(x_results[1], invert_grid(x, fx, 9.0))
+    x_results = invert_grid_batch(x, fx, [[4.0, 9.0]])
+    assert len(x_results) == 1
+    assert np.array_equal(x_results[0], invert_grid(x, fx, [4.0, 9.0]))
+
+    with pytest.raises(ValueError):
+        invert_grid_batch(x, [0, 1], y)
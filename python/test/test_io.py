@@ -187,10 +187,16 @@ def test_io():
     assert ang_cor.delta[0] == 0.3
     assert ang_cor.delta[1] == -0.4
 
-    # Calling angular_correlation with delta as an argument has the side effect that a new
-    # AngularCorrelation object is created in the C++ code which will have the new mixing ratios
-    # as members.
+    # Calling angular_correlation with delta as an argument has the side effect that the mixing
+    # ratios of the existing AngularCorrelation object in the C++ code are set to the new values,
+    # and they are used by all later calls.
     # This is demonstrated here:
     # Above, ang_cor was created with multipole mixing ratios -0.3 and 0.3, but the last call
     # was with mixing ratios 0.3 and -0.4, so it matches ang_cor_2 now.
-    np.isclose(ang_cor_2(0.3, 0.3), ang_cor(0.3, 0.3))
+    assert np.isclose(ang_cor_2(0.3, 0.3), ang_cor(0.3, 0.3))
+
+    # The mixing ratios are updated in place.
+    delta = ang_cor.delta
+    ang_cor(0.3, 0.3, None, 0.1, 0.2)
+    assert ang_cor.delta is delta
+    assert np.array_equal(delta, [0.1, 0.2])
@@ -17,6 +17,14 @@
     Copyright (C) 2021-2023 Udo Friman-Gayer
 */
 
+#include <algorithm>
+
+using std::copy;
+using std::max;
+using std::min;
+
+#include <cmath>
+
 #include <stdexcept>
 
 using std::invalid_argument;
@@ -346,6 +354,12 @@ create_angular_correlation_with_transition_inference(const size_t n_cas_ste,
   return new AngularCorrelation(initial_state, cascade_states);
 }
 
+double
+evaluate_angular_correlation_scalar(AngularCorrelation *angular_correlation,
+                                    const double theta, const double phi) {
+  return angular_correlation->operator()(theta, phi);
+}
+
 void evaluate_angular_correlation(AngularCorrelation *angular_correlation,
                                   const size_t n_angles, double *theta,
                                   double *phi, double *result) {
@@ -355,6 +369,145 @@ void evaluate_angular_correlation(AngularCorrelation *angular_correlation,
   }
 }
 
+void evaluate_angular_correlation_rotated(
+    AngularCorrelation *angular_correlation, const size_t n_angles,
+    double *theta, double *phi, double *Phi_Theta_Psi, double *result) {
+
+  // The inverse rotation, which transforms the given directions into the
+  // coordinate system of the angular correlation, is the same for all angles.
+  // Therefore, its matrix is constructed only once.
+  gsl_vector *Phi_Theta_Psi_reverse = gsl_vector_alloc(3);
+  gsl_vector_set(Phi_Theta_Psi_reverse, 0, -Phi_Theta_Psi[2]);
+  gsl_vector_set(Phi_Theta_Psi_reverse, 1, -Phi_Theta_Psi[1]);
+  gsl_vector_set(Phi_Theta_Psi_reverse, 2, -Phi_Theta_Psi[0]);
+  gsl_matrix *A = gsl_matrix_alloc(3, 3);
+  euler_angle_transform::rotation_matrix(A, Phi_Theta_Psi_reverse);
+
+  double a[3][3];
+  for (size_t i = 0; i < 3; ++i) {
+    for (size_t j = 0; j < 3; ++j) {
+      a[i][j] = gsl_matrix_get(A, i, j);
+    }
+  }
+  gsl_matrix_free(A);
+  gsl_vector_free(Phi_Theta_Psi_reverse);
+
+  double x_y_z[3], xp_yp_zp[3];
+  for (size_t n = 0; n < n_angles; ++n) {
+    x_y_z[0] = sin(theta[n]) * cos(phi[n]);
+    x_y_z[1] = sin(theta[n]) * sin(phi[n]);
+    x_y_z[2] = cos(theta[n]);
+    for (size_t i = 0; i < 3; ++i) {
+      xp_yp_zp[i] =
+          a[i][0] * x_y_z[0] + a[i][1] * x_y_z[1] + a[i][2] * x_y_z[2];
+    }
+    // Rounding errors may push the z component slightly out of [-1, 1].
+    result[n] = angular_correlation->operator()(
+        acos(max(-1., min(1., xp_yp_zp[2]))),
+        atan2(xp_yp_zp[1], xp_yp_zp[0]));
+  }
+}
+
+void evaluate_angular_correlation_multi(
+    AngularCorrelation **angular_correlations, const size_t n_ang_cor,
+    const size_t n_angles, double *theta, double *phi, double *result) {
+
+  // The results are stored row by row, i.e. the value of the i-th angular
+  // correlation at theta[k] and phi[k] is result[i*n_angles + k].
+  for (size_t i = 0; i < n_ang_cor; ++i) {
+    evaluate_angular_correlation(angular_correlations[i], n_angles, theta, phi,
+                                 result + i * n_angles);
+  }
+}
+
+void evaluate_angular_correlation_grid(AngularCorrelation *angular_correlation,
+                                       const size_t n_theta, double *theta,
+                                       const size_t n_phi, double *phi,
+                                       double *result) {
+
+  const vector<double> phi_vector(phi, phi + n_phi);
+
+  // The results are stored row by row, i.e. the value at theta[i] and phi[j]
+  // is result[i*n_phi + j]. For each polar angle, the terms that only depend
+  // on the polar angle are evaluated only once.
+  for (size_t i = 0; i < n_theta; ++i) {
+    const vector<double> w =
+        angular_correlation->at_azimuthal_angles(theta[i], phi_vector);
+    copy(w.begin(), w.end(), result + i * n_phi);
+  }
+}
+
+void evaluate_angular_correlation_delta_scan(
+    const size_t n_cas_ste, int *two_J, short *par, short *em_char, int *two_L,
+    short *em_charp, int *two_Lp, const size_t n_delta, double *delta,
+    const size_t n_angles, double *theta, double *phi, double *result) {
+
+  State initial_state{two_J[0], (Parity)par[0]};
+  vector<pair<Transition, State>> cascade_steps;
+
+  for (size_t i = 0; i < n_cas_ste; ++i) {
+    cascade_steps.push_back(
+        {Transition{(EMCharacter)em_char[i], two_L[i], (EMCharacter)em_charp[i],
+                    two_Lp[i], 0.},
+         State{two_J[i + 1], (Parity)par[i + 1]}});
+  }
+
+  // Only the mixing ratios change in the loop below, so the cascade is checked
+  // and its coefficients are created only once.
+  AngularCorrelation ang_cor(initial_state, cascade_steps);
+
+  // The angular functions do not depend on the mixing ratios either, so the
+  // (associated) Legendre polynomials are evaluated only once for each angle.
+  // For each set of mixing ratios, the angular correlation is then only a
+  // product of the expansion coefficients with this table.
+  vector<vector<double>> angular_basis;
+  for (size_t k = 0; k < n_angles; ++k) {
+    angular_basis.push_back(ang_cor.get_angular_basis(theta[k], phi[k]));
+  }
+
+  // The mixing ratios are stored row by row, i.e. the n_cas_ste mixing ratios
+  // of the i-th set are delta[i*n_cas_ste], ..., delta[(i+1)*n_cas_ste - 1].
+  for (size_t i = 0; i < n_delta; ++i) {
+    ang_cor.set_deltas(vector<double>(delta + i * n_cas_ste,
+                                      delta + (i + 1) * n_cas_ste));
+    for (size_t k = 0; k < n_angles; ++k) {
+      result[i * n_angles + k] =
+          ang_cor.evaluate_angular_basis(angular_basis[k]);
+    }
+  }
+}
+
+void evaluate_analyzing_power(AngularCorrelation *angular_correlation,
+                              const size_t n_angles, double *theta,
+                              double *thetap, double *phi, double *phip,
+                              const double prefactor, double *result) {
+
+  for (size_t i = 0; i < n_angles; ++i) {
+    double w_para, w_perp;
+    if (theta[i] == thetap[i]) {
+      // Evaluate the terms which only depend on the polar angle only once.
+      const pair<double, double> w =
+          angular_correlation->at_two_azimuthal_angles(theta[i], phi[i],
+                                                       phip[i]);
+      w_para = w.first;
+      w_perp = w.second;
+    } else {
+      w_para = angular_correlation->operator()(theta[i], phi[i]);
+      w_perp = angular_correlation->operator()(thetap[i], phip[i]);
+    }
+    const double w_sum = w_perp + w_para;
+    // If the angular correlation vanishes in both directions, the analyzing
+    // power is set to zero instead of NaN.
+    result[i] = w_sum == 0. ? 0. : (w_para - w_perp) * prefactor / w_sum;
+  }
+}
+
+void set_deltas_angular_correlation(AngularCorrelation *angular_correlation,
+                                    double *delta) {
+  const size_t n_cas_ste = angular_correlation->get_cascade_steps().size();
+  angular_correlation->set_deltas(vector<double>(delta, delta + n_cas_ste));
+}
+
 void free_angular_correlation(AngularCorrelation *angular_correlation) {
   delete angular_correlation;
 }
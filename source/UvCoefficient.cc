@@ -33,6 +33,7 @@ UvCoefficient::UvCoefficient(const unsigned int two_nu, const int two_j,
       two_jp(two_jp) {
 
   value_L = phase_norm_6j_symbol(two_nu, two_j, two_L, two_jp);
+  value_Lp_unmixed = phase_norm_6j_symbol(two_nu, two_j, two_Lp, two_jp);
   value_Lp = 0.;
   value = value_L;
 }
@@ -44,10 +45,15 @@ UvCoefficient::UvCoefficient(const unsigned int two_nu, const int two_j,
       two_jp(two_jp) {
 
   value_L = phase_norm_6j_symbol(two_nu, two_j, two_L, two_jp);
+  value_Lp_unmixed = phase_norm_6j_symbol(two_nu, two_j, two_Lp, two_jp);
+  set_delta(delta);
+}
+
+void UvCoefficient::set_delta(const double delta) {
+  this->delta = delta;
 
   if (delta != 0.) {
-    value_Lp =
-        delta * delta * phase_norm_6j_symbol(two_nu, two_j, two_Lp, two_jp);
+    value_Lp = delta * delta * value_Lp_unmixed;
   } else {
     value_Lp = 0.;
   }
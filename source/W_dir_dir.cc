@@ -23,8 +23,6 @@
 
 #include "State.hh"
 
-#include <gsl/gsl_sf.h>
-
 #include "W_dir_dir.hh"
 
 using std::max;
@@ -39,13 +37,71 @@ W_dir_dir::W_dir_dir(const State &ini_sta,
   expansion_coefficients = calculate_expansion_coefficients();
 }
 
+void W_dir_dir::set_deltas(const vector<double> &deltas) {
+  W_gamma_gamma::set_deltas(deltas);
+
+  normalization_factor = calculate_normalization_factor();
+  uv_coefficient_products.clear();
+  expansion_coefficients = calculate_expansion_coefficients();
+}
+
 double W_dir_dir::operator()(const double theta) const {
+  return at_cos_theta(cos(theta));
+}
+
+double W_dir_dir::at_cos_theta(const double cos_theta) const {
+
+  // The Legendre polynomials are obtained from the upward recurrence relation
+  // in the degree, which yields all of them in a single pass instead of
+  // evaluating each polynomial from scratch. Only the polynomials of even
+  // degree contribute.
+  double legendre_nu_minus_1{0.}, legendre_nu{1.}, legendre_nu_plus_1{0.};
+  double sum_over_nu{0.};
+
+  for (int nu = 0; nu <= nu_max; ++nu) {
+    if (nu % 2 == 0) {
+      sum_over_nu += expansion_coefficients[nu / 2] * legendre_nu;
+    }
+    legendre_nu_plus_1 =
+        ((2. * nu + 1.) * cos_theta * legendre_nu - nu * legendre_nu_minus_1) /
+        (nu + 1.);
+    legendre_nu_minus_1 = legendre_nu;
+    legendre_nu = legendre_nu_plus_1;
+  }
+
+  return sum_over_nu * normalization_factor;
+}
+
+vector<double> W_dir_dir::get_angular_basis(const double theta,
+                                            const double) const {
+
+  // Same recurrence relation as in the call operator, so that
+  // evaluate_angular_basis() reproduces its results exactly.
+  const double x = cos(theta);
+  double legendre_nu_minus_1{0.}, legendre_nu{1.}, legendre_nu_plus_1{0.};
+  vector<double> angular_basis;
+
+  for (int nu = 0; nu <= nu_max; ++nu) {
+    if (nu % 2 == 0) {
+      angular_basis.push_back(legendre_nu);
+    }
+    legendre_nu_plus_1 =
+        ((2. * nu + 1.) * x * legendre_nu - nu * legendre_nu_minus_1) /
+        (nu + 1.);
+    legendre_nu_minus_1 = legendre_nu;
+    legendre_nu = legendre_nu_plus_1;
+  }
+
+  return angular_basis;
+}
+
+double W_dir_dir::evaluate_angular_basis(
+    const vector<double> &angular_basis) const {
 
   double sum_over_nu{0.};
 
   for (int i = 0; i <= nu_max / 2; ++i) {
-    sum_over_nu +=
-        expansion_coefficients[i] * gsl_sf_legendre_Pl(2 * i, cos(theta));
+    sum_over_nu += expansion_coefficients[i] * angular_basis[i];
   }
 
   return sum_over_nu * normalization_factor;
@@ -116,15 +172,21 @@ vector<double> W_dir_dir::calculate_expansion_coefficients_Av() {
 
   vector<double> exp_coef;
 
+  // The AvCoefficient objects do not depend on the mixing ratios. They only
+  // need to be created once, and can be reused by W_dir_dir::set_deltas().
+  const bool create_av_coefficients = av_coefficients_excitation.empty();
+
   for (int two_nu = 0; two_nu <= two_nu_max; two_nu += 4) {
-    av_coefficients_excitation.push_back(AvCoefficient(
-        two_nu, cascade_steps[0].first.two_L, cascade_steps[0].first.two_Lp,
-        initial_state.two_J, cascade_steps[0].second.two_J));
-    av_coefficients_decay.push_back(
-        AvCoefficient(two_nu, cascade_steps[n_cascade_steps - 1].first.two_L,
-                      cascade_steps[n_cascade_steps - 1].first.two_Lp,
-                      cascade_steps[n_cascade_steps - 1].second.two_J,
-                      cascade_steps[n_cascade_steps - 2].second.two_J));
+    if (create_av_coefficients) {
+      av_coefficients_excitation.push_back(AvCoefficient(
+          two_nu, cascade_steps[0].first.two_L, cascade_steps[0].first.two_Lp,
+          initial_state.two_J, cascade_steps[0].second.two_J));
+      av_coefficients_decay.push_back(
+          AvCoefficient(two_nu, cascade_steps[n_cascade_steps - 1].first.two_L,
+                        cascade_steps[n_cascade_steps - 1].first.two_Lp,
+                        cascade_steps[n_cascade_steps - 1].second.two_J,
+                        cascade_steps[n_cascade_steps - 2].second.two_J));
+    }
     exp_coef.push_back(
         av_coefficients_excitation[two_nu / 4](cascade_steps[0].first.delta) *
         av_coefficients_decay[two_nu / 4](
@@ -139,13 +201,25 @@ vector<double> W_dir_dir::calculate_expansion_coefficients_Uv() {
   vector<double> exp_coef;
   double uv_coef_product = 1.;
 
+  // As for the AvCoefficient objects, the Wigner-6j symbols of the
+  // UvCoefficient objects do not depend on the mixing ratios. The objects are
+  // only created once, and W_dir_dir::set_deltas() updates their mixing ratios.
+  const bool create_uv_coefficients = uv_coefficients.empty();
+
   for (int two_nu = 0; two_nu <= two_nu_max; two_nu += 4) {
-    uv_coefficients.push_back(vector<UvCoefficient>());
+    if (create_uv_coefficients) {
+      uv_coefficients.push_back(vector<UvCoefficient>());
+    }
     for (size_t i = 1; i < n_cascade_steps - 1; ++i) {
-      uv_coefficients[two_nu / 4].push_back(UvCoefficient(
-          two_nu, cascade_steps[i - 1].second.two_J,
-          cascade_steps[i].first.two_L, cascade_steps[i].first.two_Lp,
-          cascade_steps[i].first.delta, cascade_steps[i].second.two_J));
+      if (create_uv_coefficients) {
+        uv_coefficients[two_nu / 4].push_back(UvCoefficient(
+            two_nu, cascade_steps[i - 1].second.two_J,
+            cascade_steps[i].first.two_L, cascade_steps[i].first.two_Lp,
+            cascade_steps[i].first.delta, cascade_steps[i].second.two_J));
+      } else {
+        uv_coefficients[two_nu / 4][i - 1].set_delta(
+            cascade_steps[i].first.delta);
+      }
       uv_coef_product =
           uv_coef_product * uv_coefficients[two_nu / 4][i - 1].get_value();
     }
@@ -36,22 +36,130 @@ W_pol_dir::W_pol_dir(const State &ini_sta,
   normalization_factor = w_dir_dir.get_normalization_factor();
 }
 
+void W_pol_dir::set_deltas(const vector<double> &deltas) {
+  W_gamma_gamma::set_deltas(deltas);
+
+  w_dir_dir.set_deltas(deltas);
+  expansion_coefficients = calculate_expansion_coefficients();
+  normalization_factor = w_dir_dir.get_normalization_factor();
+}
+
 double W_pol_dir::operator()(const double theta, const double phi) const {
 
+  const double cos_theta = cos(theta);
+
+  return w_dir_dir.at_cos_theta(cos_theta) +
+         cos(2. * phi) * polarization_term(cos_theta) *
+             w_dir_dir.get_normalization_factor();
+}
+
+pair<double, double>
+W_pol_dir::at_two_azimuthal_angles(const double theta, const double phi,
+                                   const double phip) const {
+
+  const double cos_theta = cos(theta);
+  const double w_dir_dir_theta = w_dir_dir.at_cos_theta(cos_theta);
+  const double polarization_term_theta = polarization_term(cos_theta);
+
+  return {w_dir_dir_theta + cos(2. * phi) * polarization_term_theta *
+                                w_dir_dir.get_normalization_factor(),
+          w_dir_dir_theta + cos(2. * phip) * polarization_term_theta *
+                                w_dir_dir.get_normalization_factor()};
+}
+
+vector<double> W_pol_dir::at_azimuthal_angles(const double theta,
+                                              const vector<double> &phi) const {
+
+  const double cos_theta = cos(theta);
+  const double w_dir_dir_theta = w_dir_dir.at_cos_theta(cos_theta);
+  const double polarization_term_theta = polarization_term(cos_theta);
+
+  vector<double> result(phi.size());
+  for (size_t j = 0; j < phi.size(); ++j) {
+    result[j] = w_dir_dir_theta + cos(2. * phi[j]) * polarization_term_theta *
+                                      w_dir_dir.get_normalization_factor();
+  }
+
+  return result;
+}
+
+vector<double> W_pol_dir::get_angular_basis(const double theta,
+                                            const double phi) const {
+
+  vector<double> angular_basis = w_dir_dir.get_angular_basis(theta, phi);
+
+  angular_basis.push_back(cos(2. * phi));
+
+  // Same recurrence relation as in W_pol_dir::polarization_term(), so that
+  // evaluate_angular_basis() reproduces the results of the call operator
+  // exactly.
+  const double x = cos(theta);
+  double legendre_nu_minus_1{0.}, legendre_nu{3. * (1. - x) * (1. + x)},
+      legendre_nu_plus_1{0.};
+
+  for (int nu = 2; nu <= nu_max; ++nu) {
+    if (nu % 2 == 0) {
+      angular_basis.push_back(legendre_nu);
+    }
+    legendre_nu_plus_1 =
+        ((2. * nu + 1.) * x * legendre_nu - (nu + 2.) * legendre_nu_minus_1) /
+        (nu - 1.);
+    legendre_nu_minus_1 = legendre_nu;
+    legendre_nu = legendre_nu_plus_1;
+  }
+
+  return angular_basis;
+}
+
+double W_pol_dir::evaluate_angular_basis(
+    const vector<double> &angular_basis) const {
+
+  // The first nu_max / 2 + 1 angular functions belong to the dir-dir
+  // correlation, the next one is cos(2 phi).
+  const int cos_2_phi_index = nu_max / 2 + 1;
+
   double sum_over_nu{0.};
 
   for (int i = 1; i <= nu_max / 2; ++i) {
-    sum_over_nu += expansion_coefficients[i - 1] *
-                   gsl_sf_legendre_Plm(2 * i, 2, cos(theta));
+    sum_over_nu +=
+        expansion_coefficients[i - 1] * angular_basis[cos_2_phi_index + i];
   }
 
-  int polarization_sign = 1;
   if (cascade_steps[0].first.em_charp == magnetic) {
-    polarization_sign = -1;
+    sum_over_nu = -sum_over_nu;
   }
 
-  return w_dir_dir(theta) + polarization_sign * cos(2. * phi) * sum_over_nu *
-                                w_dir_dir.get_normalization_factor();
+  return w_dir_dir.evaluate_angular_basis(angular_basis) +
+         angular_basis[cos_2_phi_index] * sum_over_nu *
+             w_dir_dir.get_normalization_factor();
+}
+
+double W_pol_dir::polarization_term(const double cos_theta) const {
+
+  // The associated Legendre functions of order 2 are obtained from the upward
+  // recurrence relation in the degree, which starts at P_2^2(x) = 3 (1 - x^2).
+  // Only the functions of even degree contribute.
+  double legendre_nu_minus_1{0.},
+      legendre_nu{3. * (1. - cos_theta) * (1. + cos_theta)},
+      legendre_nu_plus_1{0.};
+  double sum_over_nu{0.};
+
+  for (int nu = 2; nu <= nu_max; ++nu) {
+    if (nu % 2 == 0) {
+      sum_over_nu += expansion_coefficients[nu / 2 - 1] * legendre_nu;
+    }
+    legendre_nu_plus_1 = ((2. * nu + 1.) * cos_theta * legendre_nu -
+                          (nu + 2.) * legendre_nu_minus_1) /
+                         (nu - 1.);
+    legendre_nu_minus_1 = legendre_nu;
+    legendre_nu = legendre_nu_plus_1;
+  }
+
+  if (cascade_steps[0].first.em_charp == magnetic) {
+    return -sum_over_nu;
+  }
+
+  return sum_over_nu;
 }
 
 double W_pol_dir::get_upper_limit() const {
@@ -93,15 +201,22 @@ vector<double> W_pol_dir::calculate_expansion_coefficients_alphav_Av() {
 
   vector<double> exp_coef;
 
+  // The AlphavCoefficient and AvCoefficient objects do not depend on the mixing
+  // ratios. They only need to be created once, and can be reused by
+  // W_pol_dir::set_deltas().
+  const bool create_coefficients = alphav_coefficients.empty();
+
   for (int two_nu = 4; two_nu <= two_nu_max; two_nu += 4) {
-    alphav_coefficients.push_back(AlphavCoefficient(
-        two_nu, cascade_steps[0].first.two_L, cascade_steps[0].first.two_Lp,
-        initial_state.two_J, cascade_steps[0].second.two_J));
-    av_coefficients.push_back(
-        AvCoefficient(two_nu, cascade_steps[n_cascade_steps - 1].first.two_L,
-                      cascade_steps[n_cascade_steps - 1].first.two_Lp,
-                      cascade_steps[n_cascade_steps - 1].second.two_J,
-                      cascade_steps[n_cascade_steps - 2].second.two_J));
+    if (create_coefficients) {
+      alphav_coefficients.push_back(AlphavCoefficient(
+          two_nu, cascade_steps[0].first.two_L, cascade_steps[0].first.two_Lp,
+          initial_state.two_J, cascade_steps[0].second.two_J));
+      av_coefficients.push_back(
+          AvCoefficient(two_nu, cascade_steps[n_cascade_steps - 1].first.two_L,
+                        cascade_steps[n_cascade_steps - 1].first.two_Lp,
+                        cascade_steps[n_cascade_steps - 1].second.two_J,
+                        cascade_steps[n_cascade_steps - 2].second.two_J));
+    }
     exp_coef.push_back(
         alphav_coefficients[two_nu / 4 - 1](cascade_steps[0].first.delta) *
         av_coefficients[two_nu / 4 - 1](
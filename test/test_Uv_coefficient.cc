@@ -52,4 +52,10 @@ int main() {
   assert(uv_coef->string_representation() ==
          "U_{4}\\left(4,1,3\\right)+U_{4}\\left(4,2,3\\right)\\delta^{2}");
   assert(uv_coef->string_representation(3) == "0.681+0\\times\\delta^{2}");
+
+  // Test that changing the mixing ratio gives the same result as creating a new
+  // object with this mixing ratio.
+  uv_coef->set_delta(0.5);
+  assert(uv_coef->get_value() ==
+         UvCoefficient(8, 8, 2, 4, 0.5, 6).get_value());
 }
\ No newline at end of file
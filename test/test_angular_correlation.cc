@@ -97,4 +97,51 @@ int main() {
   // Test the copy constructor
   AngularCorrelation ang_corr_0_1_0_prime = ang_corr_0_1_0;
   assert(ang_corr_0_1_0_prime(0.1, 0.2) == ang_corr_0_1_0(0.1, 0.2));
-}
\ No newline at end of file
+  // Test that setting the mixing ratios gives the same result as creating a new
+  // object with these mixing ratios, both for a dir-dir correlation with an
+  // unobserved intermediate transition and for a pol-dir correlation.
+  AngularCorrelation ang_corr_mixed_dir_dir{
+      State(3, parity_unknown),
+      {{Transition(em_unknown, 2, em_unknown, 4, 0.), State(5, parity_unknown)},
+       {Transition(em_unknown, 2, em_unknown, 4, 0.), State(3, parity_unknown)},
+       {Transition(em_unknown, 2, em_unknown, 4, 0.),
+        State(5, parity_unknown)}}};
+  ang_corr_mixed_dir_dir.set_deltas({0.1, -0.2, 0.3});
+  AngularCorrelation ang_corr_mixed_dir_dir_new{
+      State(3, parity_unknown),
+      {{Transition(em_unknown, 2, em_unknown, 4, 0.1),
+        State(5, parity_unknown)},
+       {Transition(em_unknown, 2, em_unknown, 4, -0.2),
+        State(3, parity_unknown)},
+       {Transition(em_unknown, 2, em_unknown, 4, 0.3),
+        State(5, parity_unknown)}}};
+
+  AngularCorrelation ang_corr_mixed_pol_dir{
+      State(0, positive),
+      {{Transition(electric, 2, magnetic, 4, 0.), State(2, negative)},
+       {Transition(electric, 2, magnetic, 4, 0.), State(4, positive)}}};
+  ang_corr_mixed_pol_dir.set_deltas({0.5, -0.5});
+  AngularCorrelation ang_corr_mixed_pol_dir_new{
+      State(0, positive),
+      {{Transition(electric, 2, magnetic, 4, 0.5), State(2, negative)},
+       {Transition(electric, 2, magnetic, 4, -0.5), State(4, positive)}}};
+
+  for (double theta = 0.; theta < M_PI; theta += 0.5) {
+    for (double phi = 0.; phi < 2. * M_PI; phi += 0.5) {
+      test_numerical_equality<double>(ang_corr_mixed_dir_dir(theta, phi),
+                                      ang_corr_mixed_dir_dir_new(theta, phi),
+                                      epsilon);
+      test_numerical_equality<double>(ang_corr_mixed_pol_dir(theta, phi),
+                                      ang_corr_mixed_pol_dir_new(theta, phi),
+                                      epsilon);
+    }
+  }
+
+  bool error_thrown = false;
+  try {
+    ang_corr_mixed_pol_dir.set_deltas({0.5});
+  } catch (const invalid_argument &e) {
+    error_thrown = true;
+  }
+  assert(error_thrown);
+}
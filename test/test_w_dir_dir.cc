@@ -60,6 +60,33 @@ int main() {
     test_numerical_equality<double>(w_dir_dir_num, w_dir_dir_ana, epsilon);
   }
 
+  // Test the evaluation with precomputed angular functions, which are reused
+  // after the mixing ratios have been changed.
+  W_dir_dir w_dir_dir_mixed(State(3), {
+                                          {Transition(2, 4, 0.), State(5)},
+                                          {Transition(2, 4, 0.), State(3)},
+                                      });
+  const vector<double> angular_basis =
+      w_dir_dir_mixed.get_angular_basis(0.5, 0.);
+  for (double delta = -3.; delta <= 3.; delta += 0.5) {
+    w_dir_dir_mixed.set_deltas({delta, -delta});
+    test_numerical_equality<double>(
+        w_dir_dir_mixed.evaluate_angular_basis(angular_basis),
+        w_dir_dir_mixed(0.5), epsilon);
+  }
+
+  // Test the evaluation at several azimuthal angles, which has no effect on the
+  // direction-direction correlation.
+  const vector<double> w_phi =
+      w_dir_dir_mixed.at_azimuthal_angles(0.5, {0., 1., 2.});
+  assert(w_phi.size() == 3);
+  for (double w : w_phi) {
+    test_numerical_equality<double>(w, w_dir_dir_mixed(0.5), epsilon);
+  }
+
+  // Test the evaluation for a given cosine of the polar angle.
+  assert(w_dir_dir_mixed.at_cos_theta(cos(0.5)) == w_dir_dir_mixed(0.5));
+
   // Test string representation.
   // As a test case, use the 0->1->2 direction-direction correlation in
   // Sec. "4 Numerical example" of Ref. \cite Iliadis2021.
@@ -160,6 +160,57 @@ int main() {
     }
   }
 
+  // Test the evaluation at two azimuthal angles, which shares the terms that
+  // only depend on the polar angle.
+  pair<double, double> w_two_phi;
+  for (double theta = 0.; theta < M_PI; theta += 0.5) {
+    for (double phi = 0.; phi < 2. * M_PI; phi += 0.5) {
+      w_two_phi = w_pol_dir_e1.at_two_azimuthal_angles(theta, phi, M_PI_2);
+      test_numerical_equality<double>(w_two_phi.first,
+                                      w_pol_dir_e1(theta, phi), epsilon);
+      test_numerical_equality<double>(w_two_phi.second,
+                                      w_pol_dir_e1(theta, M_PI_2), epsilon);
+
+      w_two_phi = w_pol_dir_m1.at_two_azimuthal_angles(theta, phi, M_PI_2);
+      test_numerical_equality<double>(w_two_phi.first,
+                                      w_pol_dir_m1(theta, phi), epsilon);
+      test_numerical_equality<double>(w_two_phi.second,
+                                      w_pol_dir_m1(theta, M_PI_2), epsilon);
+    }
+  }
+
+  // Test the evaluation at several azimuthal angles, which shares the terms
+  // that only depend on the polar angle as well.
+  const vector<double> phi{0., 0.5, 1., 1.5, 2., 2.5, 3.};
+  vector<double> w_phi;
+  for (double theta = 0.; theta < M_PI; theta += 0.5) {
+    w_phi = w_pol_dir_e1.at_azimuthal_angles(theta, phi);
+    assert(w_phi.size() == phi.size());
+    for (size_t j = 0; j < phi.size(); ++j) {
+      test_numerical_equality<double>(w_phi[j], w_pol_dir_e1(theta, phi[j]),
+                                      epsilon);
+    }
+  }
+
+  // Test the evaluation with precomputed angular functions, which are reused
+  // after the mixing ratios have been changed.
+  W_pol_dir w_pol_dir_mixed(
+      State(3, positive),
+      {{Transition(magnetic, 2, electric, 4, 0.), State(3, positive)},
+       {Transition(magnetic, 2, electric, 4, 0.), State(5, positive)}});
+  for (double theta = 0.; theta < M_PI; theta += 0.5) {
+    for (double phi = 0.; phi < 2. * M_PI; phi += 0.5) {
+      const vector<double> angular_basis =
+          w_pol_dir_mixed.get_angular_basis(theta, phi);
+      for (double delta = -3.; delta <= 3.; delta += 1.5) {
+        w_pol_dir_mixed.set_deltas({delta, -delta});
+        test_numerical_equality<double>(
+            w_pol_dir_mixed.evaluate_angular_basis(angular_basis),
+            w_pol_dir_mixed(theta, phi), epsilon);
+      }
+    }
+  }
+
   // Test string representation.
   // As a test case, use the 0->1->2 direction-direction correlation in
   // Sec. "4 Numerical example" of Ref. \cite Iliadis2021.